@@ -1,10 +1,23 @@
+import os
+
 import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from pipeline import *
+from engine import (
+    apply_assumption_overrides,
+    cube_point_interpolated,
+    load_scenario_cube,
+    make_engine_data,
+    run_engine,
+    scenario_fingerprint
+)
+from ingestion import load_employee_base
 from PIL import Image
 
+enable_copy_on_write()
+
 def download_csv_button(df, filename, label="Download CSV"):
     csv = df.to_csv(index=False).encode("utf-8")
     st.download_button(
@@ -15,6 +28,13 @@ def download_csv_button(df, filename, label="Download CSV"):
         use_container_width=True
     )
 
+def label_cohorts(df):
+    # Cohort-level frames carry integer cohort codes; tables and
+    # downloads show them as "YYYY_T"
+    if df is None:
+        return None
+    return df.assign(cohort=cohort_labels(df["cohort"]))
+
 # ==========================================================
 # CONFIG
 # ==========================================================
@@ -268,30 +288,20 @@ INDUSTRY_RATES = "data/P2 Industry rates.csv"
 EMPLOYEE_SALARY = "data/Employee_Salary_Data_2025.csv"
 META_INFO = "data/Meta_info.csv"
 ECONOMIC_FILE = "data/Economic Parameters.csv"
-@st.cache_data
-def load_employee():
-    return pd.read_csv(EMPLOYEE_SALARY)
 
-@st.cache_data
-def load_meta():
-    return pd.read_csv(META_INFO)
-
-@st.cache_data
-def load_economic():
-    df = pd.read_csv(ECONOMIC_FILE)
-    df["Industry"] = df["Industry"].str.lower().str.strip()
-    return df
+# Optional, built by precompute_cube.py
+SCENARIO_CUBE_FILE = "data/scenario_cube.npz"
 
-employee_master = load_employee()
-meta_master = load_meta()
-economic_master = load_economic()
+# Engine results kept on disk across restarts, shared by all
+# Streamlit processes on the host
+RESULT_CACHE_DIR = ".cache/results"
 
 # ==========================================================
 # LOAD BASE DATA
 # ==========================================================
 
 @st.cache_data
-def load_base():
+def load_base_raw():
     industry_desc_df = pd.read_csv(INDUSTRY_DESC)
     industry_rates_df = pd.read_csv(INDUSTRY_RATES)
 
@@ -300,13 +310,41 @@ def load_base():
         industry_rates_df
     )
 
+# Shared categorical Industry / Age_Bracket keys for every stage
+@st.cache_data
+def load_key_dtypes():
+    return build_key_dtypes(
+        load_base_raw(),
+        load_employee_base(EMPLOYEE_SALARY),
+        pd.read_csv(META_INFO),
+        pd.read_csv(ECONOMIC_FILE)
+    )
+
+@st.cache_data
+def load_base():
+    return normalize_keys(load_base_raw(), *load_key_dtypes())
+
+@st.cache_data
+def load_employee():
+    # Pre-aggregated artifact, parsed once per file version (ingestion.py)
+    return normalize_keys(load_employee_base(EMPLOYEE_SALARY), *load_key_dtypes())
+
+@st.cache_data
+def load_meta():
+    return normalize_keys(pd.read_csv(META_INFO), *load_key_dtypes())
+
+@st.cache_data
+def load_economic():
+    df = pd.read_csv(ECONOMIC_FILE)
+    df = normalize_keys(df, *load_key_dtypes())
+    df["Industry"] = normalize_key(df["Industry"])
+    return df
+
+employee_master = load_employee()
+meta_master = load_meta()
+economic_master = load_economic()
 
 merged_df = load_base()
-# Optimize types for faster groupby/merge
-if "Industry" in merged_df.columns:
-    merged_df["Industry"] = merged_df["Industry"].astype("category")
-if "Age_Bracket" in merged_df.columns:
-    merged_df["Age_Bracket"] = merged_df["Age_Bracket"].astype("category")
 
 
 if "industry_assumptions" not in st.session_state:
@@ -316,130 +354,53 @@ if "industry_assumptions" not in st.session_state:
 # ENGINE FUNCTIONS
 # ==========================================================
 
-@st.cache_data(show_spinner=False)
+# Stage inputs shared by every session; fingerprinted once
+@st.cache_resource
+def load_engine_data():
+    return make_engine_data(employee_master, meta_master, economic_master)
+
+engine_data = load_engine_data()
+
+# Threads for the survival and fund stages; the ENGINE_WORKERS
+# environment variable overrides the CPU count
+ENGINE_WORKERS = int(os.environ.get("ENGINE_WORKERS", os.cpu_count() or 1))
+
+# Precomputed Fund Return × TER cube: slider moves it covers are a
+# lookup. A cube from other engine code is dropped on load; one for
+# other data or edited assumptions is ignored by run_engine, and the
+# engine runs live.
+@st.cache_resource
+def load_cube():
+    if not os.path.exists(SCENARIO_CUBE_FILE):
+        return None
+    return load_scenario_cube(SCENARIO_CUBE_FILE)
+
+# Each stage is memoized in engine.py on its own inputs, so a slider
+# change only recomputes the stages downstream of it
 def run_full_engine(industry_assumptions,
                     fund_return,
                     ter_rate,
                     leakage_rate,
                     output_delta,
                     gva_delta,
-                    employment_delta):
-
-    # ==========================================================
-    # 1️⃣ Employee + Salary Forecast
-    # ==========================================================
+                    employment_delta,
+                    workers=ENGINE_WORKERS):
 
-    emp_forecast, sal_forecast = generate_employee_salary_forecast(
-        employee_master,
+    return run_engine(
+        engine_data,
         industry_assumptions,
-        start_year=BASE_YEAR
+        fund_return,
+        ter_rate,
+        leakage_rate,
+        output_delta,
+        gva_delta,
+        employment_delta,
+        start_year=BASE_YEAR,
+        workers=workers,
+        cube=load_cube(),
+        disk_cache=RESULT_CACHE_DIR
     )
 
-    # ==========================================================
-    # 2️⃣ Survival Template
-    # ==========================================================
-
-    survival_template = generate_survival_template_cohort_style(
-        meta_master,
-        start_year=BASE_YEAR
-    )
-
-    # ==========================================================
-    # 3️⃣ Attach Salary
-    # ==========================================================
-
-    survival_with_salary = attach_salary_to_survival(
-        survival_template,
-        sal_forecast
-    )
-
-    # ==========================================================
-    # 4️⃣ Attach Employees
-    # ==========================================================
-
-    survival_with_emp = attach_employees_to_survival(
-        survival_with_salary,
-        emp_forecast
-    )
-
-    # ==========================================================
-    # 5️⃣ Attach Exit & Replacement Rates
-    # ==========================================================
-
-    survival_ready = attach_exit_and_replacement(
-        survival_with_emp,
-        industry_assumptions
-    )
-
-    # ==========================================================
-    # 6️⃣ Run Full Survival + EOSG + Fund Engine
-    # ==========================================================
-
-    combined_df = run_full_survival_eosg_model(
-        survival_ready,
-        fund_return_rate=fund_return,
-        ter_rate=ter_rate,
-        start_year=BASE_YEAR
-    )
-
-    # ==========================================================
-    # 7️⃣ Aggregate Industry × Year
-    # ==========================================================
-
-    industry_year = aggregate_industry_year_combined(
-        combined_df
-    )
-
-    # ==========================================================
-    # 8️⃣ Apply Economic Layer
-    # ==========================================================
-
-    economic_adj = economic_master.copy()
-
-    economic_adj["Output_Multiplier_Type_I"] = (
-        economic_adj["Output_Multiplier_Type_I"] + output_delta
-    ).clip(lower=0)
-
-    economic_adj["GVA_to_Output_Ratio"] = (
-        economic_adj["GVA_to_Output_Ratio"] + gva_delta
-    ).clip(lower=0)
-
-    economic_adj["Employment_Multiplier (jobs per AED 1M output)"] = (
-        economic_adj["Employment_Multiplier (jobs per AED 1M output)"] + employment_delta
-    ).clip(lower=0)
-    
-    impact_df = apply_economic_impact_combined(
-        industry_year,
-        economic_adj,
-        leakage_rate
-    )
-
-    impact_df = impact_df.rename(columns={
-        "output_impact": "Output_Impact",
-        "gva_impact": "GVA_Impact",
-        "jobs_impact": "Jobs_Impact"
-    })
-
-    economic_df = economic_master.copy()
-
-    impact_df = impact_df.merge(
-        economic_df[["Industry", "SectorMap"]],
-        left_on="industry",
-        right_on="Industry",
-        how="left"
-    )
-
-    impact_df.drop(columns=["Industry"], inplace=True)
-    # ==========================================================
-    # 9️⃣ Drop Base Year
-    # ==========================================================
-
-    combined_df = combined_df[combined_df["year"] > BASE_YEAR]
-    industry_year = industry_year[industry_year["year"] > BASE_YEAR]
-    impact_df = impact_df[impact_df["year"] > BASE_YEAR]
-
-    return combined_df, industry_year, impact_df
-
 
 with st.sidebar:
 
@@ -553,8 +514,12 @@ with st.sidebar:
 # STATIC BASELINE (DOES NOT CHANGE)
 # ==========================================================
 
-if "baseline_cache" not in st.session_state:
-    st.session_state.baseline_cache = run_full_engine(
+# Computed once per process (or read from the on-disk result cache
+# after a restart) and shared by every session without copying.
+# Read-only: never modify these frames in place.
+@st.cache_resource(show_spinner=False)
+def load_baseline():
+    return run_full_engine(
         merged_df,
         BASE_RETURN,
         0.01,
@@ -564,26 +529,14 @@ if "baseline_cache" not in st.session_state:
         0.0
     )
 
-combined_static, industry_static, impact_static = st.session_state.baseline_cache
-
-
+combined_static, industry_static, impact_static = load_baseline()
 
-assumptions_adj = st.session_state.industry_assumptions.copy()
 
-# Apply workforce override
-assumptions_adj["Expansion Hiring %"] = (
-    assumptions_adj["Expansion Hiring %"] + workforce_override
-).clip(lower=0)
 
-# Apply salary override
-assumptions_adj["Salary Growth %"] = (
-    assumptions_adj["Salary Growth %"] + salary_override
-).clip(lower=0)
-
-# Recalculate derived
-assumptions_adj["Total Hiring %"] = (
-    assumptions_adj["Expansion Hiring %"] +
-    assumptions_adj["Replacement Hiring %"]
+assumptions_adj = apply_assumption_overrides(
+    st.session_state.industry_assumptions,
+    workforce_override,
+    salary_override
 )
 
 combined_full, industry_full, impact_full = run_full_engine(
@@ -596,15 +549,42 @@ combined_full, industry_full, impact_full = run_full_engine(
     employment_delta
 )
 
+# Cohort-level output is None when the scenario cube served the run
+if combined_full is None and cube_point_interpolated(
+    load_cube(), fund_return, ter_rate
+):
+    st.sidebar.caption(
+        "Fund Return / TER fall between precomputed scenario points: "
+        "figures are interpolated (rerun precompute_cube.py with a "
+        "finer --return-step for exact values)."
+    )
+
+# Token for combined_full: a hash of the assumptions and parameters,
+# so cached functions never hash the cohort-level frame itself
+scenario_token = scenario_fingerprint(
+    engine_data,
+    assumptions_adj,
+    fund_return,
+    ter_rate,
+    start_year=BASE_YEAR
+)
+
+# _df is skipped by Streamlit's argument hashing; scenario_token
+# identifies it. Kept in memory only: the cohort-level frame is too
+# large to be worth a disk write per scenario.
 @st.cache_data(show_spinner=False)
-def run_fund_scenarios(df):
-    return generate_cohort_fund_scenarios(df)
+def run_fund_scenarios(_df, scenario_token, return_rates=DEFAULT_SCENARIO_RETURN_RATES):
+    return generate_cohort_fund_scenarios(_df, return_rates=tuple(return_rates))
 
-fund_scenarios_full = run_fund_scenarios(combined_full)
+# Cohort-level output is None when the scenario cube served the run
+fund_scenarios_full = label_cohorts(
+    run_fund_scenarios(combined_full, scenario_token)
+    if combined_full is not None else None
+)
 
 if selected_industry == "All Industries":
 
-    combined_dyn = combined_full.copy()
+    combined_dyn = label_cohorts(combined_full)
     industry_dyn = industry_full.copy()
     impact_dyn = impact_full.copy()
 
@@ -612,9 +592,12 @@ else:
 
     selected_industry_lower = selected_industry.lower()
 
-    combined_dyn = combined_full[
-        combined_full["industry"] == selected_industry_lower
-    ].copy()
+    combined_dyn = label_cohorts(
+        combined_full[
+            combined_full["industry"] == selected_industry_lower
+        ]
+        if combined_full is not None else None
+    )
 
     industry_dyn = industry_full[
         industry_full["industry"] == selected_industry_lower
@@ -1163,7 +1146,7 @@ with tabs[2]:
     if year_selection == "All Years":
 
         eco_display = (
-            df_eco.groupby("industry", as_index=False)
+            df_eco.groupby("industry", as_index=False, observed=True)
             .agg(
                 GDP=("GVA_Impact", "sum"),
                 Jobs=("Jobs_Impact", "sum"),
@@ -0,0 +1,475 @@
+"""
+Headless benchmark suite for the dashboard engine (no Streamlit needed).
+
+    python benchmark.py
+    python benchmark.py --scenarios bundled employees_x10 --output bench.json
+    python benchmark.py --compare previous_bench.json
+
+Times and memory-profiles every run_full_engine stage on the bundled
+data/ files and on synthetically scaled inputs, and writes the results
+as JSON so runs from different commits can be compared.
+
+Each scenario runs in a fresh process so its peak RSS is its own.
+The cache_key_* rows compare keying a cache on the cohort-level
+output frame with keying it on the scenario token.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import numpy as np
+import pandas as pd
+
+from pipeline import *
+from engine import frame_fingerprint, make_engine_data, scenario_fingerprint
+
+
+BASE_YEAR = 2025
+
+INDUSTRY_DESC = "data/Industry Desc.csv"
+INDUSTRY_RATES = "data/P2 Industry rates.csv"
+EMPLOYEE_SALARY = "data/Employee_Salary_Data_2025.csv"
+META_INFO = "data/Meta_info.csv"
+ECONOMIC_FILE = "data/Economic Parameters.csv"
+
+# employee_scale: microdata rows replicated N times
+# industry_scale: every industry cloned N times (scales cohort frames)
+# end_year:       projection horizon
+SCENARIOS = {
+    "bundled": dict(employee_scale=1, industry_scale=1, end_year=2040),
+    "employees_x10": dict(employee_scale=10, industry_scale=1, end_year=2040),
+    "employees_x100": dict(employee_scale=100, industry_scale=1, end_year=2040),
+    "industries_x10": dict(employee_scale=1, industry_scale=10, end_year=2040),
+    "horizon_2060": dict(employee_scale=1, industry_scale=1, end_year=2060),
+}
+
+
+def peak_rss_mb():
+    """
+    Peak resident set size of this process in MB (None on Windows).
+    """
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    # Linux reports KB, macOS reports bytes
+    if sys.platform == "darwin":
+        return peak / 1024 ** 2
+
+    return peak / 1024
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ==========================================================
+# INPUTS
+# ==========================================================
+
+def _clone_industries(df, n_copies):
+    if n_copies == 1:
+        return df
+
+    clones = []
+    for k in range(n_copies):
+        clone = df.copy()
+        if k > 0:
+            clone["Industry"] = clone["Industry"].astype(str) + f" #{k}"
+        clones.append(clone)
+
+    return pd.concat(clones, ignore_index=True)
+
+
+def load_inputs(employee_scale=1, industry_scale=1):
+    raw = generate_merged_industry_data(
+        pd.read_csv(INDUSTRY_DESC),
+        pd.read_csv(INDUSTRY_RATES)
+    )
+
+    employee = pd.read_csv(EMPLOYEE_SALARY)
+    meta = pd.read_csv(META_INFO)
+    economic = pd.read_csv(ECONOMIC_FILE)
+
+    if employee_scale > 1:
+        employee = pd.concat(
+            [employee] * employee_scale,
+            ignore_index=True
+        )
+
+    raw = _clone_industries(raw, industry_scale)
+    employee = _clone_industries(employee, industry_scale)
+    meta = _clone_industries(meta, industry_scale)
+    economic = _clone_industries(economic, industry_scale)
+
+    key_dtypes = build_key_dtypes(raw, employee, meta, economic)
+
+    economic = normalize_keys(economic, *key_dtypes)
+    economic["Industry"] = normalize_key(economic["Industry"])
+
+    return {
+        "merged": normalize_keys(raw, *key_dtypes),
+        "employee": normalize_keys(employee, *key_dtypes),
+        "meta": normalize_keys(meta, *key_dtypes),
+        "economic": economic
+    }
+
+
+# ==========================================================
+# STAGES
+# ==========================================================
+
+def run_stages(
+    inputs,
+    end_year=2040,
+    fund_return=0.08,
+    ter_rate=0.01,
+    leakage_rate=0.28,
+    trace_memory=False,
+    workers=1
+):
+    """
+    Runs the run_full_engine stage sequence and returns
+    one record per stage: seconds, output rows and (when
+    trace_memory) the peak of traced allocations made during the
+    stage, above what was already allocated when it started.
+    """
+    records = []
+
+    def stage(name, fn, *args, **kwargs):
+        if trace_memory:
+            tracemalloc.reset_peak()
+            allocated_before = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        out = fn(*args, **kwargs)
+        seconds = time.perf_counter() - start
+
+        record = {"stage": name, "seconds": seconds}
+
+        if trace_memory:
+            record["peak_traced_mb"] = (
+                tracemalloc.get_traced_memory()[1] - allocated_before
+            ) / 1024 ** 2
+
+        first = out[0] if isinstance(out, tuple) else out
+        record["rows"] = len(first)
+
+        records.append(record)
+        return out
+
+    emp_forecast, sal_forecast = stage(
+        "forecast",
+        generate_employee_salary_forecast,
+        inputs["employee"],
+        inputs["merged"],
+        start_year=BASE_YEAR,
+        end_year=end_year
+    )
+
+    survival_template = stage(
+        "survival_template",
+        generate_survival_template_cohort_style,
+        inputs["meta"],
+        start_year=BASE_YEAR,
+        end_year=end_year
+    )
+
+    survival_with_salary = stage(
+        "attach_salary",
+        attach_salary_to_survival,
+        survival_template,
+        sal_forecast
+    )
+
+    survival_with_emp = stage(
+        "attach_employees",
+        attach_employees_to_survival,
+        survival_with_salary,
+        emp_forecast
+    )
+
+    survival_pruned = stage(
+        "prune_cohorts",
+        prune_empty_cohorts,
+        survival_with_emp,
+        start_year=BASE_YEAR
+    )
+    records[-1]["pruned_fraction"] = 1 - len(survival_pruned) / len(survival_with_emp)
+
+    survival_ready = stage(
+        "attach_exit_replacement",
+        attach_exit_and_replacement,
+        survival_pruned,
+        inputs["merged"],
+        end_year=end_year
+    )
+
+    ledger = stage(
+        "survival_liability",
+        run_survival_liability_model,
+        survival_ready,
+        start_year=BASE_YEAR,
+        workers=workers
+    )
+
+    combined_df = stage(
+        "fund",
+        run_fund_model,
+        ledger,
+        fund_return_rate=fund_return,
+        ter_rate=ter_rate,
+        start_year=BASE_YEAR,
+        workers=workers
+    )
+
+    industry_year = stage(
+        "aggregate",
+        aggregate_industry_year_combined,
+        combined_df
+    )
+
+    stage(
+        "economic",
+        apply_economic_impact_combined,
+        industry_year,
+        inputs["economic"],
+        leakage_rate
+    )
+
+    return records
+
+
+def time_cache_keys(inputs, end_year=2040, repeat=3):
+    """
+    Cost of keying a cache on the cohort-level output frame (content
+    hash of combined_df) versus on the scenario token.
+    """
+    emp_forecast, sal_forecast = generate_employee_salary_forecast(
+        inputs["employee"],
+        inputs["merged"],
+        start_year=BASE_YEAR,
+        end_year=end_year
+    )
+
+    survival_template = generate_survival_template_cohort_style(
+        inputs["meta"],
+        start_year=BASE_YEAR,
+        end_year=end_year
+    )
+
+    survival_ready = attach_exit_and_replacement(
+        attach_employees_to_survival(
+            attach_salary_to_survival(survival_template, sal_forecast),
+            emp_forecast
+        ),
+        inputs["merged"],
+        end_year=end_year
+    )
+
+    combined_df = run_full_survival_eosg_model(
+        survival_ready,
+        start_year=BASE_YEAR
+    )
+
+    # Built once per process (st.cache_resource in the app)
+    data = make_engine_data(
+        inputs["employee"],
+        inputs["meta"],
+        inputs["economic"]
+    )
+
+    def best(fn):
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return [
+        {
+            "stage": "cache_key_frame_hash",
+            "seconds": best(lambda: frame_fingerprint(combined_df)),
+            "rows": len(combined_df)
+        },
+        {
+            "stage": "cache_key_token",
+            "seconds": best(lambda: scenario_fingerprint(
+                data, inputs["merged"], 0.08, 0.01, start_year=BASE_YEAR
+            )),
+            "rows": len(inputs["merged"])
+        }
+    ]
+
+
+def run_scenario(name, repeat=1, workers=1):
+    """
+    Benchmarks one scenario: best-of-repeat untraced timings, then
+    one traced run for per-stage peak memory.
+    """
+    enable_copy_on_write()
+
+    params = SCENARIOS[name]
+
+    start = time.perf_counter()
+    inputs = load_inputs(params["employee_scale"], params["industry_scale"])
+    load_seconds = time.perf_counter() - start
+
+    timings = [
+        run_stages(inputs, end_year=params["end_year"], workers=workers)
+        for _ in range(repeat)
+    ]
+
+    tracemalloc.start()
+    traced = run_stages(
+        inputs,
+        end_year=params["end_year"],
+        trace_memory=True,
+        workers=workers
+    )
+    tracemalloc.stop()
+
+    records = [{
+        "scenario": name,
+        "stage": "load_inputs",
+        "seconds": load_seconds,
+        "rows": len(inputs["employee"])
+    }]
+
+    for i, rec in enumerate(traced):
+        records.append({
+            "scenario": name,
+            "stage": rec["stage"],
+            "seconds": min(run[i]["seconds"] for run in timings),
+            "peak_traced_mb": rec["peak_traced_mb"],
+            "rows": rec["rows"],
+            **{k: rec[k] for k in ("pruned_fraction",) if k in rec}
+        })
+
+    records.append({
+        "scenario": name,
+        "stage": "total",
+        "seconds": sum(r["seconds"] for r in records[1:]),
+        "peak_rss_mb": peak_rss_mb(),
+        "rows": records[-1]["rows"]
+    })
+
+    for rec in time_cache_keys(inputs, params["end_year"], max(repeat, 3)):
+        records.append({"scenario": name, **rec})
+
+    return records
+
+
+def run_isolated(name, repeat=1, workers=1):
+    # Fresh interpreter per scenario so peak RSS is not inherited
+    with ProcessPoolExecutor(
+        max_workers=1,
+        mp_context=get_context("spawn")
+    ) as pool:
+        return pool.submit(run_scenario, name, repeat, workers).result()
+
+
+# ==========================================================
+# REPORTING
+# ==========================================================
+
+def _print_table(records, baseline=None):
+    base = {}
+    if baseline:
+        base = {
+            (r["scenario"], r["stage"]): r["seconds"]
+            for r in baseline["results"]
+        }
+
+    header = f"{'scenario':<16}{'stage':<26}{'seconds':>10}{'peak MB':>10}{'rows':>12}"
+    if base:
+        header += f"{'vs base':>10}"
+    print(header)
+
+    for r in records:
+        peak = r.get("peak_traced_mb", r.get("peak_rss_mb"))
+        line = (
+            f"{r['scenario']:<16}{r['stage']:<26}"
+            f"{r['seconds']:>10.3f}"
+            f"{(f'{peak:.1f}' if peak is not None else '-'):>10}"
+            f"{r['rows']:>12,}"
+        )
+        prev = base.get((r["scenario"], r["stage"]))
+        if prev:
+            line += f"{r['seconds'] / prev:>9.2f}x"
+        print(line)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=list(SCENARIOS),
+        default=list(SCENARIOS)
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="threads for the survival and fund stages"
+    )
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument(
+        "--compare",
+        help="previous results file to compare timings against"
+    )
+    args = parser.parse_args(argv)
+
+    records = []
+    for name in args.scenarios:
+        records.extend(run_isolated(name, args.repeat, args.workers))
+
+    results = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "numba": NUMBA_AVAILABLE,
+        "workers": args.workers,
+        "results": records
+    }
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    _print_table(records, baseline)
+    print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
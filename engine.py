@@ -0,0 +1,983 @@
+"""
+Stage graph for the dashboard engine.
+
+    template ──> survival ──> fund ──> aggregate ──> stitch ──> economic
+                 └────────── per industry ──────────┘
+
+(survival runs forecast → attach → survival/liability ledger.)
+
+Every stage is memoized on a fingerprint of only its own inputs: its
+parameters plus the fingerprints of the stages it reads. Moving the
+Leakage % slider or a multiplier delta therefore reruns only the
+economic stage, and a Fund Return % / TER change only reruns the fund
+roll-forward over the cached survival ledger and what follows it.
+
+Survival, fund and aggregation do not mix industries, so they are
+cached per industry on that industry's assumption rows. Changing one
+industry's assumptions recomputes that industry only; the economic
+layer allocates across industries and runs on the stitched output.
+
+Cached stage outputs are shared between callers (and Streamlit
+sessions) and must be treated as read-only.
+"""
+
+import hashlib
+import itertools
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import numpy as np
+import pandas as pd
+
+from pipeline import *
+from fingerprints import (
+    code_version,
+    fingerprint,
+    frame_fingerprint,
+    frame_header
+)
+from result_cache import cache_get, cache_put
+
+
+# Full engine results kept per stage, least recently used evicted
+# first. Per-industry stages hold one entry per industry and result.
+STAGE_CACHE_SIZES = {
+    "template": 2,
+    "survival": 8,
+    "fund": 16,
+    "aggregate": 16,
+    "combined": 4,
+    "industry_year": 16,
+    "economic": 64,
+    "result": 16
+}
+
+_stage_cache = {stage: OrderedDict() for stage in STAGE_CACHE_SIZES}
+_stage_runs = {stage: 0 for stage in STAGE_CACHE_SIZES}
+_cache_lock = threading.Lock()
+
+
+# ==========================================================
+# FINGERPRINTS
+# ==========================================================
+
+def industry_fingerprints(assumptions):
+    """
+    {industry: fingerprint of its assumption rows}, keyed by the
+    lowercased industry name used in engine outputs.
+    """
+    header = frame_header(assumptions)
+    row_hash = pd.util.hash_pandas_object(
+        assumptions, index=True
+    ).to_numpy()
+
+    # Plain string keys (frames not run through normalize_keys)
+    # are grouped the same way as categorical ones
+    industry = normalize_key(assumptions["Industry"]).astype("category")
+    codes = industry.cat.codes.to_numpy()
+
+    fingerprints = {}
+
+    for code in np.unique(codes[codes >= 0]):
+        h = hashlib.sha1(header)
+        h.update(row_hash[codes == code].tobytes())
+        fingerprints[industry.cat.categories[code]] = h.hexdigest()
+
+    return fingerprints
+
+
+def scenario_fingerprint(
+    data,
+    industry_assumptions,
+    fund_return,
+    ter_rate,
+    start_year=2025
+):
+    """
+    Cheap token identifying run_engine's cohort-level output
+    (combined_df): input data, assumptions, fund parameters and
+    engine source. Hashes the small assumptions table only, so
+    callers can key caches on it instead of on the output frames.
+    """
+    return fingerprint(
+        "scenario",
+        data["fingerprints"]["employee"],
+        data["fingerprints"]["meta"],
+        frame_fingerprint(industry_assumptions),
+        fund_return,
+        ter_rate,
+        start_year,
+        code_version()
+    )
+
+
+# ==========================================================
+# MEMOIZATION
+# ==========================================================
+
+def _evict(stage, entries_per_result=1):
+    cache = _stage_cache[stage]
+    while len(cache) > STAGE_CACHE_SIZES[stage] * entries_per_result:
+        cache.popitem(last=False)
+
+
+def _memo_get(stage, key):
+    cache = _stage_cache[stage]
+
+    with _cache_lock:
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+    return None
+
+
+def _memo_put(stage, key, result):
+    with _cache_lock:
+        _stage_cache[stage][key] = result
+        _evict(stage)
+
+
+def _memoized(stage, key, compute):
+    result = _memo_get(stage, key)
+    if result is not None:
+        return result
+
+    result = compute()
+
+    _memo_put(stage, key, result)
+
+    with _cache_lock:
+        _stage_runs[stage] += 1
+
+    return result
+
+
+def _memoized_by_industry(stage, keys, compute):
+    """
+    keys maps industry → cache key. compute(industries) runs the
+    stage once for every industry that missed and returns a single
+    frame with an "industry" column, which is split and cached per
+    industry. Returns {industry: frame}.
+    """
+    cache = _stage_cache[stage]
+    results = {}
+
+    with _cache_lock:
+        for industry, key in keys.items():
+            if key in cache:
+                cache.move_to_end(key)
+                results[industry] = cache[key]
+
+    missing = [industry for industry in keys if industry not in results]
+
+    if missing:
+        frame = compute(missing)
+        pieces = dict(tuple(
+            frame.groupby("industry", observed=True, sort=False)
+        ))
+
+        with _cache_lock:
+            for industry in missing:
+                results[industry] = pieces.get(industry, frame.iloc[:0])
+                cache[keys[industry]] = results[industry]
+
+            _stage_runs[stage] += 1
+            _evict(stage, len(keys))
+
+    return results
+
+
+def _stitch(pieces, industries):
+    return pd.concat(
+        [pieces[industry] for industry in industries],
+        ignore_index=True
+    )
+
+
+def stage_run_counts():
+    """
+    How many times each stage has actually been computed.
+    """
+    with _cache_lock:
+        return dict(_stage_runs)
+
+
+def clear_stage_cache():
+    with _cache_lock:
+        for cache in _stage_cache.values():
+            cache.clear()
+
+
+# ==========================================================
+# ENGINE INPUTS
+# ==========================================================
+
+def make_engine_data(employee_df, meta_info_df, economic_df):
+    """
+    Static engine inputs with their fingerprints, computed once.
+    """
+    return {
+        "employee": employee_df,
+        "meta": meta_info_df,
+        "economic": economic_df,
+        "industries": sorted(
+            normalize_key(meta_info_df["Industry"]).dropna().unique()
+        ),
+        "fingerprints": {
+            "employee": frame_fingerprint(employee_df),
+            "meta": frame_fingerprint(meta_info_df),
+            "economic": frame_fingerprint(economic_df)
+        }
+    }
+
+
+def apply_assumption_overrides(
+    industry_assumptions,
+    workforce_override=0.0,
+    salary_override=0.0
+):
+    """
+    Sidebar workforce / salary growth overrides on top of the
+    industry assumptions, with Total Hiring % recalculated.
+    """
+    assumptions = industry_assumptions.copy()
+
+    # Apply workforce override
+    assumptions["Expansion Hiring %"] = (
+        assumptions["Expansion Hiring %"] + workforce_override
+    ).clip(lower=0)
+
+    # Apply salary override
+    assumptions["Salary Growth %"] = (
+        assumptions["Salary Growth %"] + salary_override
+    ).clip(lower=0)
+
+    # Recalculate derived
+    assumptions["Total Hiring %"] = (
+        assumptions["Expansion Hiring %"] +
+        assumptions["Replacement Hiring %"]
+    )
+
+    return assumptions
+
+
+# ==========================================================
+# STAGES
+# ==========================================================
+
+def _for_industries(df, industries):
+    return df[normalize_key(df["Industry"]).isin(industries)]
+
+
+def _survival_stage(
+    data,
+    survival_template,
+    assumptions,
+    industries,
+    start_year,
+    workers
+):
+    """
+    Forecast → attach → survival/liability ledger for a subset of
+    industries. Cohorts that never hold members are pruned before
+    the survival sweep.
+    """
+    assumptions = _for_industries(assumptions, industries)
+
+    emp_forecast, sal_forecast = generate_employee_salary_forecast(
+        _for_industries(data["employee"], industries),
+        assumptions,
+        start_year=start_year
+    )
+
+    survival_with_salary = attach_salary_to_survival(
+        _for_industries(survival_template, industries),
+        sal_forecast
+    )
+
+    survival_with_emp = attach_employees_to_survival(
+        survival_with_salary,
+        emp_forecast
+    )
+
+    survival_ready = attach_exit_and_replacement(
+        prune_empty_cohorts(survival_with_emp, start_year=start_year),
+        assumptions
+    )
+
+    return run_survival_liability_model(
+        survival_ready,
+        start_year=start_year,
+        workers=workers
+    )
+
+
+def apply_economic_layer(
+    industry_year,
+    economic_df,
+    leakage_rate,
+    output_delta,
+    gva_delta,
+    employment_delta
+):
+    """
+    Adjusted multipliers → economic impact, with dashboard column
+    names and SectorMap attached.
+    """
+    economic_adj = economic_df.copy(deep=False)
+
+    economic_adj["Output_Multiplier_Type_I"] = (
+        economic_adj["Output_Multiplier_Type_I"] + output_delta
+    ).clip(lower=0)
+
+    economic_adj["GVA_to_Output_Ratio"] = (
+        economic_adj["GVA_to_Output_Ratio"] + gva_delta
+    ).clip(lower=0)
+
+    economic_adj["Employment_Multiplier (jobs per AED 1M output)"] = (
+        economic_adj["Employment_Multiplier (jobs per AED 1M output)"] + employment_delta
+    ).clip(lower=0)
+
+    impact_df = apply_economic_impact_combined(
+        industry_year,
+        economic_adj,
+        leakage_rate
+    )
+
+    impact_df = impact_df.rename(columns={
+        "output_impact": "Output_Impact",
+        "gva_impact": "GVA_Impact",
+        "jobs_impact": "Jobs_Impact"
+    })
+
+    impact_df = impact_df.merge(
+        economic_df[["Industry", "SectorMap"]],
+        left_on="industry",
+        right_on="Industry",
+        how="left"
+    )
+
+    impact_df.drop(columns=["Industry"], inplace=True)
+
+    return impact_df
+
+
+def survival_ledgers(
+    data,
+    industry_assumptions,
+    start_year=2025,
+    workers=1
+):
+    """
+    Template → forecast → attach → survival/liability ledger, memoized
+    per industry. Returns ({industry: survival key},
+    {industry: ledger}).
+    """
+    data_fp = data["fingerprints"]
+    assumptions_fp = industry_fingerprints(industry_assumptions)
+
+    # ==========================================================
+    # 1️⃣ Survival Template
+    # ==========================================================
+    template_key = fingerprint("template", data_fp["meta"], start_year)
+
+    survival_template = _memoized(
+        "template",
+        template_key,
+        lambda: generate_survival_template_cohort_style(
+            data["meta"],
+            start_year=start_year
+        )
+    )
+
+    # ==========================================================
+    # 2️⃣ Forecast + Attach + Survival Ledger (per industry)
+    # ==========================================================
+    survival_keys = {
+        industry: fingerprint(
+            "survival",
+            industry,
+            template_key,
+            data_fp["employee"],
+            assumptions_fp.get(industry),
+            start_year
+        )
+        for industry in data["industries"]
+    }
+
+    ledgers = _memoized_by_industry(
+        "survival",
+        survival_keys,
+        lambda missing: _survival_stage(
+            data,
+            survival_template,
+            industry_assumptions,
+            missing,
+            start_year,
+            workers
+        )
+    )
+
+    return survival_keys, ledgers
+
+
+def run_engine(
+    data,
+    industry_assumptions,
+    fund_return,
+    ter_rate,
+    leakage_rate,
+    output_delta,
+    gva_delta,
+    employment_delta,
+    start_year=2025,
+    workers=1,
+    cube=None,
+    disk_cache=None
+):
+    """
+    Full engine through the memoized stage graph.
+
+    Returns (combined_df, industry_year, impact_df) with the base
+    year dropped, as the dashboard shows them. workers sets the
+    threads used by the survival and fund stages; it does not change
+    the results, so it is not part of any cache key.
+
+    With a scenario cube built for the same data and assumptions,
+    (fund_return, ter_rate) points it covers are served from the cube
+    and combined_df is None.
+
+    Results are memoized in process. disk_cache is an optional
+    result_cache directory: results are also kept there, keyed on
+    the data, assumptions, parameters and engine source, so they
+    survive restarts and are shared between processes. It is only
+    read when the in-process memo misses.
+    """
+    data_fp = data["fingerprints"]
+    industries = data["industries"]
+
+    # ==========================================================
+    # 0️⃣ Precomputed Scenario Cube
+    # ==========================================================
+    if cube is not None and cube["fingerprint"] == cube_fingerprint(
+        data, industry_assumptions, start_year
+    ):
+        industry_year = lookup_scenario_cube(cube, fund_return, ter_rate)
+
+        if industry_year is not None:
+            impact_df = apply_economic_layer(
+                industry_year,
+                data["economic"],
+                leakage_rate,
+                output_delta,
+                gva_delta,
+                employment_delta
+            )
+
+            industry_year = industry_year[industry_year["year"] > start_year]
+            impact_df = impact_df[impact_df["year"] > start_year]
+
+            return None, industry_year, impact_df
+
+    # ==========================================================
+    # 0️⃣ In-Process Memo, then Persistent Result Cache
+    # ==========================================================
+    result_key = fingerprint(
+        "run_engine",
+        scenario_fingerprint(
+            data,
+            industry_assumptions,
+            fund_return,
+            ter_rate,
+            start_year
+        ),
+        data_fp["economic"],
+        leakage_rate,
+        output_delta,
+        gva_delta,
+        employment_delta
+    )
+
+    stored = _memo_get("result", result_key)
+
+    if stored is None and disk_cache is not None:
+        stored = cache_get(disk_cache, result_key)
+        if stored is not None:
+            _memo_put("result", result_key, stored)
+
+    if stored is not None:
+        return stored
+
+    survival_keys, ledgers = survival_ledgers(
+        data,
+        industry_assumptions,
+        start_year=start_year,
+        workers=workers
+    )
+
+    # ==========================================================
+    # 1️⃣ Fund Engine (per industry)
+    # ==========================================================
+    fund_keys = {
+        industry: fingerprint("fund", key, fund_return, ter_rate)
+        for industry, key in survival_keys.items()
+    }
+
+    funds = _memoized_by_industry(
+        "fund",
+        fund_keys,
+        lambda missing: run_fund_model(
+            _stitch(ledgers, missing),
+            fund_return_rate=fund_return,
+            ter_rate=ter_rate,
+            start_year=start_year,
+            workers=workers
+        )
+    )
+
+    # ==========================================================
+    # 2️⃣ Aggregate Industry × Year (per industry)
+    # ==========================================================
+    aggregate_keys = {
+        industry: fingerprint("aggregate", key)
+        for industry, key in fund_keys.items()
+    }
+
+    aggregates = _memoized_by_industry(
+        "aggregate",
+        aggregate_keys,
+        lambda missing: aggregate_industry_year_combined(
+            _stitch(funds, missing)
+        )
+    )
+
+    # ==========================================================
+    # 3️⃣ Stitch Industries
+    # ==========================================================
+    combined_df = _memoized(
+        "combined",
+        fingerprint("combined", *fund_keys.values()),
+        lambda: _stitch(funds, industries)
+    )
+
+    industry_year_key = fingerprint(
+        "industry_year", *aggregate_keys.values()
+    )
+
+    industry_year = _memoized(
+        "industry_year",
+        industry_year_key,
+        lambda: _stitch(aggregates, industries)
+    )
+
+    # ==========================================================
+    # 4️⃣ Economic Layer
+    # ==========================================================
+    economic_key = fingerprint(
+        "economic",
+        industry_year_key,
+        data_fp["economic"],
+        leakage_rate,
+        output_delta,
+        gva_delta,
+        employment_delta
+    )
+
+    impact_df = _memoized(
+        "economic",
+        economic_key,
+        lambda: apply_economic_layer(
+            industry_year,
+            data["economic"],
+            leakage_rate,
+            output_delta,
+            gva_delta,
+            employment_delta
+        )
+    )
+
+    # ==========================================================
+    # 5️⃣ Drop Base Year
+    # ==========================================================
+    combined_df = combined_df[combined_df["year"] > start_year]
+    industry_year = industry_year[industry_year["year"] > start_year]
+    impact_df = impact_df[impact_df["year"] > start_year]
+
+    result = (combined_df, industry_year, impact_df)
+
+    _memo_put("result", result_key, result)
+
+    if disk_cache is not None:
+        cache_put(disk_cache, result_key, result)
+
+    return result
+
+
+# ==========================================================
+# SCENARIO GRID
+# ==========================================================
+
+_grid_state = {}
+
+
+def _init_grid_worker(state):
+    _grid_state.update(state)
+
+
+def _fund_industry_year(state, fund_return, ter_rate):
+    combined_df = run_fund_model(
+        state["ledger"],
+        fund_return_rate=fund_return,
+        ter_rate=ter_rate,
+        start_year=state["start_year"]
+    )
+
+    return aggregate_industry_year_combined(combined_df)
+
+
+def _evaluate_fund_scenario(state, fund_return, ter_rate, leakage_rates):
+    """
+    Fund → aggregate once for (fund_return, ter_rate), then the
+    economic layer for every leakage rate. One frame per leakage.
+    """
+    start_year = state["start_year"]
+    industry_year = _fund_industry_year(state, fund_return, ter_rate)
+
+    frames = []
+
+    for leakage_rate in leakage_rates:
+        impact_df = apply_economic_layer(
+            industry_year,
+            state["economic"],
+            leakage_rate,
+            *state["deltas"]
+        )
+
+        frames.append(impact_df[impact_df["year"] > start_year])
+
+    return frames
+
+
+def _grid_worker_task(task):
+    evaluate, args = task
+    return evaluate(_grid_state, *args)
+
+
+def _map_fund_scenarios(state, evaluate, tasks, workers):
+    """
+    evaluate(state, *task) for every task, on a spawn process pool
+    when workers > 1 (state is sent once per worker). Results come
+    back in task order.
+    """
+    if workers <= 1 or len(tasks) <= 1:
+        return [evaluate(state, *task) for task in tasks]
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(tasks)),
+        mp_context=get_context("spawn"),
+        initializer=_init_grid_worker,
+        initargs=(state,)
+    ) as pool:
+        return list(pool.map(
+            _grid_worker_task,
+            [(evaluate, task) for task in tasks]
+        ))
+
+
+def run_scenario_grid(
+    data,
+    industry_assumptions,
+    fund_returns,
+    ter_rates,
+    leakage_rates,
+    output_delta=0.0,
+    gva_delta=0.0,
+    employment_delta=0.0,
+    start_year=2025,
+    workers=None,
+    output_path=None
+):
+    """
+    Headless what-if sweep over fund_returns × ter_rates ×
+    leakage_rates.
+
+    The survival ledger is built once (through the stage cache) and
+    shared; every (fund_return, ter_rate) pair runs the fund and
+    aggregation stages once, and the economic layer once per leakage.
+    Pairs are spread over a process pool of `workers` processes
+    (default: all cores, 1 runs in this process).
+
+    Returns one long-format frame, one row per scenario × industry ×
+    year, with scenario_id, fund_return, ter_rate and leakage_rate
+    in front of the economic output columns. output_path also writes
+    it as Parquet (needs pyarrow).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    fund_returns = [float(r) for r in fund_returns]
+    ter_rates = [float(r) for r in ter_rates]
+    leakage_rates = [float(r) for r in leakage_rates]
+
+    _, ledgers = survival_ledgers(
+        data,
+        industry_assumptions,
+        start_year=start_year
+    )
+
+    state = {
+        "ledger": _stitch(ledgers, data["industries"]),
+        "economic": data["economic"],
+        "deltas": (output_delta, gva_delta, employment_delta),
+        "start_year": start_year
+    }
+
+    tasks = [
+        (fund_return, ter_rate, leakage_rates)
+        for fund_return, ter_rate in itertools.product(fund_returns, ter_rates)
+    ]
+
+    results = _map_fund_scenarios(
+        state, _evaluate_fund_scenario, tasks, workers
+    )
+
+    frames = []
+    scenario_id = 0
+
+    for (fund_return, ter_rate, _), impact_frames in zip(tasks, results):
+        for leakage_rate, impact_df in zip(leakage_rates, impact_frames):
+            frames.append(impact_df.assign(
+                scenario_id=scenario_id,
+                fund_return=fund_return,
+                ter_rate=ter_rate,
+                leakage_rate=leakage_rate
+            ))
+            scenario_id += 1
+
+    scenario_columns = ["scenario_id", "fund_return", "ter_rate", "leakage_rate"]
+
+    grid = pd.concat(frames, ignore_index=True)
+    grid = grid[
+        scenario_columns +
+        [c for c in grid.columns if c not in scenario_columns]
+    ]
+
+    if output_path is not None:
+        grid.to_parquet(output_path, index=False)
+
+    return grid
+
+
+# ==========================================================
+# SCENARIO CUBE
+# ==========================================================
+
+# Fund Return % and TER % slider domains (as rates)
+CUBE_FUND_RETURNS = np.round(np.arange(0.0, 0.12 + 1e-9, 0.005), 6)
+CUBE_TER_RATES = np.round(np.arange(0.0, 0.03 + 1e-9, 0.001), 6)
+
+_CUBE_TOLERANCE = 1e-9
+
+
+def cube_fingerprint(data, industry_assumptions, start_year=2025):
+    """
+    Key a scenario cube is valid for: input data, assumptions,
+    start_year and the engine source.
+    """
+    return fingerprint(
+        "cube",
+        data["fingerprints"]["employee"],
+        data["fingerprints"]["meta"],
+        frame_fingerprint(industry_assumptions),
+        start_year,
+        code_version()
+    )
+
+
+def _cube_values(state, fund_return, ter_rate):
+    industry_year = _fund_industry_year(state, fund_return, ter_rate)
+    return industry_year[state["columns"]].to_numpy(dtype=np.float64)
+
+
+def build_scenario_cube(
+    data,
+    industry_assumptions,
+    fund_returns=CUBE_FUND_RETURNS,
+    ter_rates=CUBE_TER_RATES,
+    start_year=2025,
+    workers=None
+):
+    """
+    Industry × Year aggregate output on the fund_returns × ter_rates
+    lattice, sharing one survival ledger.
+
+    Leakage and the multiplier deltas are not part of the cube: the
+    economic layer is applied live on the looked-up aggregate.
+    Values are stored as float64, so lookups at lattice points
+    match run_engine exactly.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    fund_returns = np.asarray(fund_returns, dtype=float)
+    ter_rates = np.asarray(ter_rates, dtype=float)
+
+    _, ledgers = survival_ledgers(
+        data,
+        industry_assumptions,
+        start_year=start_year
+    )
+
+    state = {
+        "ledger": _stitch(ledgers, data["industries"]),
+        "start_year": start_year
+    }
+
+    # Row labels and value columns from the first lattice point
+    first = _fund_industry_year(state, fund_returns[0], ter_rates[0])
+    state["columns"] = [
+        c for c in first.columns if c not in ("industry", "year")
+    ]
+
+    tasks = list(itertools.product(fund_returns, ter_rates))
+    values = _map_fund_scenarios(state, _cube_values, tasks, workers)
+
+    return {
+        "fingerprint": cube_fingerprint(
+            data, industry_assumptions, start_year
+        ),
+        "code_version": code_version(),
+        "fund_returns": fund_returns,
+        "ter_rates": ter_rates,
+        "industry_categories": np.asarray(
+            first["industry"].cat.categories, dtype=str
+        ),
+        "industry_codes": first["industry"].cat.codes.to_numpy(),
+        "year": first["year"].to_numpy(),
+        "columns": np.asarray(state["columns"], dtype=str),
+        "values": np.stack(values).reshape(
+            len(fund_returns), len(ter_rates), *values[0].shape
+        )
+    }
+
+
+def save_scenario_cube(cube, path):
+    np.savez_compressed(path, **cube)
+
+
+def load_scenario_cube(path, expected_fingerprint=None):
+    """
+    Cube saved by save_scenario_cube, or None when it is stale: built
+    by other engine code, or for inputs other than
+    expected_fingerprint (a cube_fingerprint) when that is given.
+    """
+    with np.load(path, allow_pickle=False) as stored:
+        cube = {name: stored[name] for name in stored.files}
+
+    if str(cube.get("code_version")) != code_version():
+        return None
+
+    cube["fingerprint"] = str(cube["fingerprint"])
+
+    if (
+        expected_fingerprint is not None
+        and cube["fingerprint"] != expected_fingerprint
+    ):
+        return None
+
+    return cube
+
+
+def _lattice_weights(axis, value, interpolate):
+    """
+    [(index, weight)] for value on a sorted lattice axis, or None
+    when it is off the lattice (or outside it).
+    """
+    i = int(np.searchsorted(axis, value - _CUBE_TOLERANCE))
+
+    if i < len(axis) and abs(axis[i] - value) <= _CUBE_TOLERANCE:
+        return [(i, 1.0)]
+
+    if not interpolate or i == 0 or i == len(axis):
+        return None
+
+    w = (value - axis[i - 1]) / (axis[i] - axis[i - 1])
+    return [(i - 1, 1.0 - w), (i, w)]
+
+
+def cube_point_interpolated(cube, fund_return, ter_rate):
+    """
+    True when lookup_scenario_cube blends lattice points for
+    (fund_return, ter_rate) rather than reading one exactly.
+    """
+    weights = [
+        _lattice_weights(cube["fund_returns"], fund_return, True),
+        _lattice_weights(cube["ter_rates"], ter_rate, True)
+    ]
+
+    return any(w is not None and len(w) > 1 for w in weights)
+
+
+def lookup_scenario_cube(cube, fund_return, ter_rate, interpolate=True):
+    """
+    Industry × Year aggregate for (fund_return, ter_rate) from the
+    cube, linearly interpolated between lattice points when
+    interpolate is set. None when the point is not covered.
+    """
+    return_weights = _lattice_weights(
+        cube["fund_returns"], fund_return, interpolate
+    )
+    ter_weights = _lattice_weights(
+        cube["ter_rates"], ter_rate, interpolate
+    )
+
+    if return_weights is None or ter_weights is None:
+        return None
+
+    values = sum(
+        wr * wt * cube["values"][i, j].astype(float)
+        for i, wr in return_weights
+        for j, wt in ter_weights
+    )
+
+    industry_year = pd.DataFrame(values, columns=list(cube["columns"]))
+
+    industry_year.insert(0, "industry", pd.Categorical.from_codes(
+        cube["industry_codes"],
+        categories=list(cube["industry_categories"])
+    ))
+    industry_year.insert(1, "year", cube["year"])
+
+    return industry_year
+
+
+# ==========================================================
+# MONTE CARLO
+# ==========================================================
+
+def run_fund_monte_carlo(
+    data,
+    industry_assumptions,
+    start_year=2025,
+    **options
+):
+    """
+    run_monte_carlo_fund on the cached survival ledger, so changing
+    only the Monte Carlo options (paths, volatility, seed, ...) never
+    reruns survival.
+    """
+    _, ledgers = survival_ledgers(
+        data,
+        industry_assumptions,
+        start_year=start_year
+    )
+
+    return run_monte_carlo_fund(
+        _stitch(ledgers, data["industries"]),
+        start_year=start_year,
+        **options
+    )
@@ -0,0 +1,78 @@
+"""
+Content hashes shared by the engine caches and the ingestion layer.
+
+fingerprint() keys in-process memos and on-disk entries alike;
+code_version() is mixed into every key that outlives the process, so
+editing the engine or ingestion source invalidates them.
+"""
+
+import functools
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+
+# Sources whose edits can change a cached result
+VERSIONED_SOURCES = (
+    "pipeline.py",
+    "engine.py",
+    "result_cache.py",
+    "ingestion.py",
+    "fingerprints.py"
+)
+
+
+def frame_header(df):
+    return (
+        repr(list(df.columns)) + repr([str(t) for t in df.dtypes])
+    ).encode()
+
+
+def frame_fingerprint(df):
+    """
+    Content hash of a DataFrame (labels, dtypes and values).
+    """
+    h = hashlib.sha1(frame_header(df))
+    h.update(
+        pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes()
+    )
+    return h.hexdigest()
+
+
+def fingerprint(*parts):
+    """
+    Hash of stage parameters: DataFrames by content, numbers by
+    their float value, everything else by repr.
+    """
+    h = hashlib.sha1()
+
+    for part in parts:
+        if isinstance(part, pd.DataFrame):
+            token = frame_fingerprint(part)
+        elif isinstance(part, (float, np.floating)):
+            token = repr(float(part))
+        else:
+            token = repr(part)
+
+        h.update(token.encode())
+        h.update(b"\0")
+
+    return h.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_version():
+    """
+    Hash of the VERSIONED_SOURCES, for caches that outlive the
+    process.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    h = hashlib.sha1()
+
+    for name in VERSIONED_SOURCES:
+        with open(os.path.join(here, name), "rb") as f:
+            h.update(f.read())
+
+    return h.hexdigest()[:12]
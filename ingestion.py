@@ -0,0 +1,201 @@
+"""
+Ingestion of the employee microdata.
+
+The CSV is parsed once with explicit compact dtypes, its headers
+validated and normalized, and pre-aggregated to the
+(Industry, Age_Brackets, Tenure) grain. The file is streamed in
+chunks, each folded into running sums, so peak memory is bounded by
+the chunk and aggregate sizes rather than the file size:
+
+    Employee_Salary_Data_2025.csv ──> typed chunks ──> running sums
+                                                        │
+                   .cache/ingest/<file hash>.arrow <───┘
+
+The aggregate is written as an uncompressed Arrow IPC (Feather v2)
+file named by the source file's content hash and the engine code
+version. Later loads memory-map it instead of parsing the CSV; the
+numeric columns are handed to pandas without copying.
+
+The artifact carries Employees and salary_x_emp sums, which
+generate_employee_salary_forecast consumes like the microdata.
+"""
+
+import hashlib
+import os
+import tempfile
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+from pyarrow import feather
+
+from pipeline import employee_base_sums
+from fingerprints import code_version, fingerprint
+
+
+INGEST_CACHE_DIR = ".cache/ingest"
+
+# Rows parsed per chunk when streaming the microdata
+CHUNK_ROWS = 1_000_000
+
+# Normalized header -> parse dtype
+EMPLOYEE_DTYPES = {
+    "Industry": "category",
+    "Age_Brackets": "category",
+    "Tenure": "int16",
+    # Headcounts may be missing or fractional (weighted counts)
+    "Employees": "float64",
+    "Average Basic Salary": "float64"
+}
+
+
+def normalize_header(name):
+    """
+    Column name with surrounding whitespace stripped and inner
+    runs of whitespace collapsed to one space.
+    """
+    return " ".join(str(name).split())
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """
+    sha1 of the file's bytes, read in chunks.
+    """
+    h = hashlib.sha1()
+
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            h.update(block)
+
+    return h.hexdigest()
+
+
+def employee_csv_columns(path):
+    """
+    Maps each required normalized column to its raw header in the
+    file. Raises ValueError naming any that are missing.
+    """
+    raw = {
+        normalize_header(c): c
+        for c in pd.read_csv(path, nrows=0).columns
+    }
+
+    missing = [c for c in EMPLOYEE_DTYPES if c not in raw]
+    if missing:
+        raise ValueError(
+            f"{path}: missing columns {missing} "
+            f"(found {list(raw)})"
+        )
+
+    return {c: raw[c] for c in EMPLOYEE_DTYPES}
+
+
+def _read_typed(path, **kwargs):
+    columns = employee_csv_columns(path)
+
+    return pd.read_csv(
+        path,
+        usecols=list(columns.values()),
+        dtype={raw: EMPLOYEE_DTYPES[c] for c, raw in columns.items()},
+        **kwargs
+    )
+
+
+def _normalized(df):
+    return df.rename(columns=normalize_header)[list(EMPLOYEE_DTYPES)]
+
+
+def read_employee_csv(path):
+    """
+    Employee microdata with normalized headers and compact dtypes;
+    columns outside EMPLOYEE_DTYPES are not parsed.
+    """
+    return _normalized(_read_typed(path))
+
+
+def iter_employee_csv(path, chunksize=CHUNK_ROWS):
+    """
+    read_employee_csv in frames of at most chunksize rows.
+    """
+    with _read_typed(path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            yield _normalized(chunk)
+
+
+def _fold_sums(running, sums):
+    """
+    Adds one chunk's employee_base_sums into the running sums.
+
+    Each chunk infers its own key categories, so the keys are
+    unioned before the frames are combined.
+    """
+    if running is None:
+        return sums
+
+    combined = pd.concat([running, sums], ignore_index=True)
+
+    for col in ("Industry", "Age_Brackets"):
+        combined[col] = union_categoricals(
+            [running[col], sums[col]],
+            sort_categories=True
+        )
+
+    return employee_base_sums(combined)
+
+
+def stream_employee_base_sums(path, chunksize=CHUNK_ROWS):
+    """
+    employee_base_sums of the whole file, folded chunk by chunk.
+    """
+    running = None
+
+    for chunk in iter_employee_csv(path, chunksize):
+        running = _fold_sums(running, employee_base_sums(chunk))
+
+    if running is None:
+        raise ValueError(f"{path}: no employee rows")
+
+    return running
+
+
+def load_employee_base(path, cache_dir=INGEST_CACHE_DIR):
+    """
+    Employees and salary_x_emp summed to the
+    (Industry, Age_Brackets, Tenure) grain, from the ingestion
+    artifact when one exists for this file's contents.
+    """
+    key = fingerprint("employee_base", file_hash(path), code_version())
+    artifact = os.path.join(cache_dir, f"{key}.arrow")
+
+    if not os.path.exists(artifact):
+        write_artifact(stream_employee_base_sums(path), artifact)
+
+    return read_artifact(artifact)
+
+
+def write_artifact(df, path):
+    """
+    Writes df as an uncompressed Arrow IPC file (compressed files
+    cannot be memory-mapped). The file is renamed into place, so
+    readers never see a partial artifact.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, staging = tempfile.mkstemp(dir=directory, suffix=".staging")
+    os.close(fd)
+
+    try:
+        feather.write_feather(df, staging, compression="uncompressed")
+        os.replace(staging, path)
+    except BaseException:
+        os.remove(staging)
+        raise
+
+
+def read_artifact(path):
+    """
+    Memory-maps an artifact from write_artifact. Numeric columns
+    without nulls reference the mapped file rather than a copy.
+    """
+    table = feather.read_table(path, memory_map=True)
+    return table.to_pandas(split_blocks=True)
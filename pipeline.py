@@ -1,6 +1,182 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+
+# ==========================================================
+# COPY-FREE HAND-OFF BETWEEN STAGES
+# ==========================================================
+# Stages never write into their input frames: they relabel columns
+# and add or replace whole columns on a shallow copy, and every
+# row-level change happens on a frame they created (merge, take,
+# groupby). Intermediate frames are therefore handed from stage to
+# stage without deep copies.
+
+def enable_copy_on_write():
+    """
+    Turns on pandas Copy-on-Write (always on from pandas 3.0), so a
+    shallow copy handed between stages can never write through to
+    the caller's data.
+    """
+    if int(pd.__version__.split(".")[0]) < 3:
+        pd.set_option("mode.copy_on_write", True)
+
+
+# ==========================================================
+# KEY NORMALIZATION
+# ==========================================================
+
+KEY_COLUMNS = {
+    "Industry": "industry",
+    "industry": "industry",
+    "Age_Bracket": "age",
+    "Age_Brackets": "age",
+    "age_bracket": "age"
+}
+
+
+def _canonical_label(label):
+    return str(label).strip().lower()
+
+
+def build_key_dtypes(*frames):
+    """
+    Shared categorical dtypes for the Industry and Age_Bracket keys,
+    built once at load time from the given frames. Pass every frame
+    that carries a key: labels missing here become NaN in
+    normalize_keys.
+
+    Labels are whitespace-stripped and sorted. Labels that differ
+    only in case are one category, spelled as first seen.
+    Returns (industry_dtype, age_dtype).
+    """
+    labels = {"industry": {}, "age": {}}
+
+    for frame in frames:
+        for col in frame.columns:
+            kind = KEY_COLUMNS.get(col.strip())
+            if kind is None:
+                continue
+            for label in frame[col].dropna().astype(str).str.strip().unique():
+                labels[kind].setdefault(label.lower(), label)
+
+    return (
+        pd.CategoricalDtype(sorted(labels["industry"].values())),
+        pd.CategoricalDtype(sorted(labels["age"].values()))
+    )
+
+
+def _cast_key(values, dtype):
+    """
+    Casts key values to a key dtype, matching labels regardless of
+    case and surrounding whitespace.
+    """
+    lookup = {_canonical_label(c): c for c in dtype.categories}
+
+    return (
+        values.astype(str).str.strip().str.lower()
+        .map(lookup)
+        .astype(dtype)
+    )
+
+
+def normalize_keys(df, industry_dtype, age_dtype):
+    """
+    Strips column names and casts the Industry / Age_Bracket key
+    columns to the shared categorical dtypes.
+
+    Lower-case key columns (industry, age_bracket) are cast to the
+    lower-cased dtypes.
+    """
+    df = df.rename(columns=lambda c: c.strip())
+
+    for col in df.columns:
+
+        kind = KEY_COLUMNS.get(col)
+        if kind is None:
+            continue
+
+        dtype = industry_dtype if kind == "industry" else age_dtype
+        if col.islower():
+            dtype = _lower_key_dtype(dtype)
+
+        if df[col].dtype != dtype:
+            df[col] = _cast_key(df[col], dtype)
+
+    return df
+
+
+def _lower_key_dtype(dtype):
+    return pd.CategoricalDtype(
+        sorted({_canonical_label(c) for c in dtype.categories})
+    )
+
+
+def normalize_key(values):
+    """
+    Stripped, lower-case merge key.
+
+    Categorical keys are normalized on their categories only (no
+    per-row string work); other keys fall back to string methods.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        dtype = _lower_key_dtype(values.dtype)
+        if values.dtype == dtype:
+            return values
+
+        # Categories that differ only in case or whitespace
+        # collapse into one
+        if len(dtype.categories) < len(values.dtype.categories):
+            return _cast_key(values, dtype)
+
+        return (
+            values.cat.rename_categories(
+                lambda c: str(c).strip().lower()
+            )
+            .cat.reorder_categories(dtype.categories)
+        )
+
+    return values.astype(str).str.strip().str.lower()
+
+
+def align_key(values, like):
+    """
+    Casts a merge key to the categorical dtype of the key it is
+    merged with, so the merge runs on category codes.
+    """
+    if (
+        isinstance(like.dtype, pd.CategoricalDtype)
+        and values.dtype != like.dtype
+    ):
+        return values.astype(like.dtype)
+
+    return values
+
+
+def _observed_key_codes(values):
+    """
+    Category codes of the labels present in a key column (in category
+    order) and the categorical dtype they refer to.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = values.cat.codes.to_numpy()
+        return np.unique(codes[codes >= 0]), values.dtype
+
+    labels = np.sort(values.dropna().unique())
+
+    return np.arange(len(labels)), pd.CategoricalDtype(labels)
+
 
 def generate_merged_industry_data(
     industry_desc,
@@ -9,8 +185,8 @@ def generate_merged_industry_data(
     output_path=None
 ):
     # Assumes industry_desc and industry_rates are already DataFrames
-    industry_desc = industry_desc.copy()
-    industry_rates = industry_rates.copy()
+    industry_desc = industry_desc.copy(deep=False)
+    industry_rates = industry_rates.copy(deep=False)
     industry_desc.columns = industry_desc.columns.str.strip()
     industry_rates.columns = industry_rates.columns.str.strip()
     if "Industry" not in industry_desc.columns:
@@ -130,6 +306,160 @@ def generate_merged_industry_data(
     return merged_df
 
 
+EMPLOYEE_KEYS = ["Industry", "Age_Brackets", "Tenure"]
+
+
+def employee_base_sums(df_emp):
+    """
+    Sums Employees and salary × employees to the
+    (Industry, Age_Brackets, Tenure) grain.
+
+    Accepts employee microdata or frames that already carry
+    salary_x_emp sums (pre-aggregated ingestion artifacts,
+    running totals over chunks of a file).
+
+    Microdata rows without a salary cannot be weighted and are
+    dropped, Employees included, with a warning.
+    """
+    df = df_emp.rename(columns=lambda c: c.strip())
+
+    df = df.rename(columns={
+        "Average Basic Salary": "Average_Base_Salary"
+    })
+
+    if "salary_x_emp" not in df.columns:
+        missing_salary = df["Average_Base_Salary"].isna()
+
+        if missing_salary.any():
+            logger.warning(
+                "Dropping %d employee rows without an Average Basic Salary",
+                int(missing_salary.sum())
+            )
+            df = df[~missing_salary]
+
+    employees = df["Employees"]
+
+    # Compact integer inputs would overflow once summed
+    if pd.api.types.is_integer_dtype(employees):
+        employees = employees.astype("int64")
+
+    if "salary_x_emp" in df.columns:
+        salary_x_emp = df["salary_x_emp"]
+    else:
+        salary_x_emp = df["Average_Base_Salary"] * employees
+
+    return (
+        df[EMPLOYEE_KEYS]
+        .assign(Employees=employees, salary_x_emp=salary_x_emp)
+        .groupby(EMPLOYEE_KEYS, as_index=False, observed=True)[["Employees", "salary_x_emp"]]
+        .sum()
+    )
+
+
+def aggregate_employee_base(df_emp):
+    """
+    Aggregates employee microdata (or employee_base_sums output)
+    to the (Industry, Age_Brackets, Tenure) grain.
+
+    Returns total Employees and the employee-weighted
+    Average_Base_Salary, from a single groupby-sum of
+    salary × employees and employees.
+    """
+    emp_agg = employee_base_sums(df_emp)
+
+    emp_agg["Average_Base_Salary"] = (
+        emp_agg.pop("salary_x_emp") / emp_agg["Employees"]
+    )
+
+    return emp_agg
+
+
+def _project_salary_panel(
+    start_salary,
+    growth,
+    first_tenure_row,
+    n_years
+):
+    """
+    Salary matrix for all (Industry, Age) groups at once.
+
+    Rows are sorted by group and tenure; first_tenure_row marks the
+    first tenure of each group. Column 0 is the base-year salary.
+    Each later column grows the previous column by one step along the
+    diagonal (tenure - 1, year - 1); the first tenure row of a group
+    grows horizontally. This is start_salary[max(i - j, 0)] * growth**j,
+    built by repeated multiplication so results match the per-group
+    matrix exactly.
+    """
+    n_rows = len(start_salary)
+    rows = np.arange(n_rows)
+
+    source = np.where(first_tenure_row, rows, rows - 1)
+
+    panel = np.empty((n_rows, n_years))
+    panel[:, 0] = start_salary
+
+    for j in range(1, n_years):
+        panel[:, j] = panel[source, j - 1] * growth
+
+    return panel
+
+
+def _project_employee_panel(employees, expansion, tenure0, n_years):
+    """
+    Incremental employee matrix (rows × years).
+
+    Column 0 is the base-year headcount. Tenure-0 rows grow their
+    cumulative headcount by (1 + expansion) a year and report the
+    yearly increment; other rows have no later inflow.
+    """
+    cumulative = np.empty((len(employees), n_years))
+    cumulative[:, 0] = employees
+
+    for j in range(1, n_years):
+        cumulative[:, j] = np.where(
+            tenure0,
+            cumulative[:, j - 1] * (1 + expansion),
+            0
+        )
+
+    panel = np.empty_like(cumulative)
+    panel[:, 0] = cumulative[:, 0]
+    panel[:, 1:] = np.diff(cumulative, axis=1)
+    panel[~tenure0, 1:] = 0
+
+    return panel
+
+
+def _forecast_long(keys, values, years, value):
+    """
+    Long forecast frame: one row per key row and year, in key then
+    year order, with an int64 Year column.
+    """
+    n_years = len(years)
+
+    long = keys.iloc[np.repeat(np.arange(len(keys)), n_years)]
+    long = long.reset_index(drop=True)
+
+    long["Year"] = np.tile(np.asarray(years, dtype=np.int64), len(keys))
+    long[value] = values.ravel()
+
+    return long
+
+
+def _forecast_wide(keys, values, years, prefix):
+    """
+    Wide prefix_YYYY layout of a forecast matrix, for export.
+    """
+    return pd.concat(
+        [
+            keys.reset_index(drop=True),
+            pd.DataFrame(values, columns=[f"{prefix}_{y}" for y in years])
+        ],
+        axis=1
+    )
+
+
 def generate_employee_salary_forecast(
     df_emp,
     merged_industry_df,
@@ -139,24 +469,23 @@ def generate_employee_salary_forecast(
     employee_output_path=None,
     salary_output_path=None
 ):
+    """
+    Projects employees and salaries per (Industry, Age_Brackets,
+    Tenure) from start_year to end_year.
 
-    df_emp = df_emp.copy()
-    df_rates = merged_industry_df.copy()
+    Returns (employee_forecast, salary_forecast) in long format:
+    Industry, Age_Brackets, Tenure, Year (int64) and Employees
+    (yearly inflow) / Salary. With save_output, the wide
+    Emp_YYYY / Salary_YYYY layout is written to the given Excel paths.
+    """
+    df_rates = merged_industry_df.copy(deep=False)
 
-    df_emp.columns = df_emp.columns.str.strip()
     df_rates.columns = df_rates.columns.str.strip()
 
-    df_emp = df_emp.rename(columns={
-        "Average Basic Salary": "Average_Base_Salary"
-    })
-
     df_rates = df_rates.rename(columns={
         "Age_Bracket": "Age_Brackets"
     })
 
-    # ==========================================================
-    # MERGE INDUSTRY RATES
-    # ==========================================================
     merge_cols = [
         "Industry",
         "Age_Brackets",
@@ -166,386 +495,1300 @@ def generate_employee_salary_forecast(
         "Expansion Hiring %"
     ]
 
-    df = df_emp.merge(
+    # ==========================================================
+    # 🔹 AGGREGATE FIRST
+    # ==========================================================
+    df = aggregate_employee_base(df_emp)
+
+    # ==========================================================
+    # MERGE INDUSTRY RATES
+    # ==========================================================
+    df = df.merge(
         df_rates[merge_cols],
         on=["Industry", "Age_Brackets"],
         how="left"
     )
 
-    df[["Total Exit (q)", "Total Hiring %", "Salary Growth %"]] = (
-        df[["Total Exit (q)", "Total Hiring %", "Salary Growth %"]]
-        .fillna(0)
+    df = df.sort_values(EMPLOYEE_KEYS)
+
+    years = list(range(start_year, end_year + 1))
+
+    # ==========================================================
+    # EMPLOYEE FORECAST
+    # ==========================================================
+    employee_panel = _project_employee_panel(
+        df["Employees"].to_numpy(dtype=float),
+        df["Expansion Hiring %"].to_numpy(dtype=float),
+        (df["Tenure"] == 0).to_numpy(),
+        len(years)
     )
 
     # ==========================================================
-    # 🔹 AGGREGATE FIRST
+    # SALARY FORECAST (MATRIX METHOD)
     # ==========================================================
+    first_tenure_row = ~df.duplicated(["Industry", "Age_Brackets"]).to_numpy()
 
-    # Employee aggregation
-    emp_agg = (
-        df.groupby(
-            ["Industry", "Age_Brackets", "Tenure"],
-            as_index=False
-        )["Employees"].sum()
+    salary_panel = _project_salary_panel(
+        df["Average_Base_Salary"].to_numpy(dtype=float),
+        1 + df["Salary Growth %"].to_numpy(dtype=float),
+        first_tenure_row,
+        len(years)
     )
 
-    # Salary weighted average
-    sal_agg = (
-        df.groupby(
-            ["Industry", "Age_Brackets", "Tenure"]
-        )
-        .apply(lambda x: np.average(
-            x["Average_Base_Salary"],
-            weights=x["Employees"]
-        ))
-        .reset_index(name="Average_Base_Salary")
+    logger.debug(
+        "Projected salary panel: %d industry/age groups, %d tenure rows, %d years",
+        int(first_tenure_row.sum()),
+        len(df),
+        len(years)
     )
 
-    df = emp_agg.merge(
-        sal_agg,
-        on=["Industry", "Age_Brackets", "Tenure"]
+    keys = df[EMPLOYEE_KEYS]
+
+    if save_output:
+
+        if employee_output_path:
+            _forecast_wide(keys, employee_panel, years, "Emp").to_excel(
+                employee_output_path, index=False
+            )
+
+        if salary_output_path:
+            _forecast_wide(keys, salary_panel, years, "Salary").to_excel(
+                salary_output_path, index=False
+            )
+
+    return (
+        _forecast_long(keys, employee_panel, years, "Employees"),
+        _forecast_long(keys, salary_panel, years, "Salary")
     )
 
-    # Attach industry rates
-    df = df.merge(
-        df_rates[merge_cols],
-        on=["Industry", "Age_Brackets"],
+# Cohort code = start_year * COHORT_TENURE_BASE + initial_tenure
+COHORT_TENURE_BASE = 1000
+
+
+def encode_cohort(start_year, initial_tenure):
+    """
+    Integer cohort code for (start_year, initial_tenure).
+    Codes sort by start year, then initial tenure.
+    """
+    return (
+        np.asarray(start_year, dtype=np.int32) * COHORT_TENURE_BASE
+        + np.asarray(initial_tenure, dtype=np.int32)
+    )
+
+
+def decode_cohort(cohort):
+    """
+    Splits cohort codes back into (start_year, initial_tenure).
+    """
+    cohort = np.asarray(cohort)
+    return cohort // COHORT_TENURE_BASE, cohort % COHORT_TENURE_BASE
+
+
+def cohort_labels(cohort):
+    """
+    Human-readable "YYYY_T" labels for cohort codes, for export.
+    Each distinct code is formatted once.
+    """
+    codes, inverse = np.unique(np.asarray(cohort), return_inverse=True)
+    start_year, initial_tenure = decode_cohort(codes)
+
+    labels = np.array(
+        [f"{s}_{t}" for s, t in zip(start_year, initial_tenure)],
+        dtype=object
+    )[inverse]
+
+    if isinstance(cohort, pd.Series):
+        return pd.Series(labels, index=cohort.index, name=cohort.name)
+
+    return labels
+
+
+def generate_survival_template_cohort_style(
+    meta_info_df,
+    start_year=2025,
+    end_year=2040
+):
+    """
+    Creates survival template in cohort format + extra fixed 2025 cohort block.
+    Structure 1:
+        Normal yearly cohorts (2025_0, 2026_0, ...)
+    Structure 2:
+        Fixed 2025 starting cohort
+        Tenure starts from 1 and increases every year
+
+    Rows are generated directly in (Industry, Age_Bracket, cohort, Year)
+    order; Industry and Age_Bracket are categorical.
+
+    cohort is an int32 code for (start_year, initial_tenure), see
+    encode_cohort; use cohort_labels for the "YYYY_T" form.
+    """
+    # Assumes meta_info_df is already a DataFrame
+    df_raw = meta_info_df.rename(columns=lambda c: c.strip())
+    industries, industry_dtype = _observed_key_codes(df_raw["Industry"])
+    age_bracket, age_dtype = _observed_key_codes(df_raw["Age_Bracket"])
+    projection_years = np.arange(start_year, end_year + 1)
+
+    max_initial_tenure = int(df_raw["Tenure"].max())
+
+    # ----------------------------------------------------------
+    # 2. ORIGINAL COHORT STRUCTURE (UNCHANGED)
+    #    cohort_start × year, kept where year >= cohort_start
+    # ----------------------------------------------------------
+    cohort_start, year = np.meshgrid(
+        projection_years, projection_years, indexing="ij"
+    )
+    active = year >= cohort_start
+
+    new_start = cohort_start[active]
+    new_year = year[active]
+    new_initial_tenure = np.zeros_like(new_start)
+
+    # ----------------------------------------------------------
+    # 3. FIXED start_year COHORTS (initial tenure 1..max)
+    # ----------------------------------------------------------
+    initial_tenure, year = np.meshgrid(
+        np.arange(1, max_initial_tenure + 1),
+        projection_years,
+        indexing="ij"
+    )
+
+    old_initial_tenure = initial_tenure.ravel()
+    old_year = year.ravel()
+    old_start = np.full_like(old_year, start_year)
+
+    # ----------------------------------------------------------
+    # 4. ONE BLOCK, IN SORTED ORDER
+    # ----------------------------------------------------------
+    block_start = np.concatenate([new_start, old_start])
+    block_initial_tenure = np.concatenate(
+        [new_initial_tenure, old_initial_tenure]
+    )
+    block_year = np.concatenate([new_year, old_year])
+
+    block_cohort = encode_cohort(block_start, block_initial_tenure)
+
+    order = np.lexsort((block_year, block_cohort))
+
+    block_cohort = block_cohort[order]
+    block_year = block_year[order]
+    block_tenure = (
+        block_initial_tenure[order]
+        + (block_year - block_start[order])
+    )
+
+    # ----------------------------------------------------------
+    # 5. REPEAT FOR EVERY INDUSTRY × AGE BRACKET
+    # ----------------------------------------------------------
+    n_block = len(block_year)
+    n_ind = len(industries)
+    n_age = len(age_bracket)
+
+    industry_codes = np.repeat(industries, n_age * n_block)
+    age_codes = np.tile(np.repeat(age_bracket, n_block), n_ind)
+
+    survival_template = pd.DataFrame({
+        "Industry": pd.Categorical.from_codes(
+            industry_codes, dtype=industry_dtype
+        ),
+        "Age_Bracket": pd.Categorical.from_codes(
+            age_codes, dtype=age_dtype
+        ),
+        "cohort": np.tile(block_cohort, n_ind * n_age),
+        "Year": np.tile(block_year, n_ind * n_age).astype(np.int64),
+        "Tenure": np.tile(block_tenure, n_ind * n_age).astype(np.int64)
+    })
+
+    return survival_template
+
+
+# ==========================================================
+# FORECAST PANELS
+# ==========================================================
+
+def _key_positions(values, labels):
+    """
+    Position of each key value in labels (a pd.Index), -1 where absent.
+    Categorical keys are looked up on their categories only.
+    """
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        lookup = labels.get_indexer(values.cat.categories)
+        codes = values.cat.codes.to_numpy()
+        return np.where(codes >= 0, lookup[codes], -1)
+
+    return labels.get_indexer(values)
+
+
+def _key_labels(values):
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return pd.Index(values.cat.categories)
+
+    return pd.Index(values.dropna().unique())
+
+
+def forecast_panel(forecast_df, value, prefix):
+    """
+    Dense panel of one forecast value, from the long output of
+    generate_employee_salary_forecast (Year and value columns) or
+    a wide layout (prefix_YYYY columns).
+
+    Returns a dict with the industry and age_bracket label indexes,
+    the first tenure and year (tenure0, year0), and values: a float
+    array indexed [industry, age_bracket, tenure - tenure0,
+    year - year0]. Key combinations absent from the forecast are NaN.
+    Forecast keys are assumed unique.
+    """
+    df = forecast_df.rename(columns=lambda c: c.strip())
+    df = df.rename(columns={"Age_Brackets": "Age_Bracket"})
+
+    if "Year" in df.columns:
+        year = df["Year"].to_numpy()
+        years = np.unique(year)
+        points = df[value].to_numpy(dtype=float)
+    else:
+        year_cols = [c for c in df.columns if c.startswith(f"{prefix}_")]
+        years = np.array([int(c[len(prefix) + 1:]) for c in year_cols])
+        year = years[None, :]
+        points = df[year_cols].to_numpy(dtype=float)
+
+    industry = _key_labels(df["Industry"])
+    age_bracket = _key_labels(df["Age_Bracket"])
+    tenure = df["Tenure"].to_numpy()
+
+    tenure0 = int(tenure.min())
+    year0 = int(years.min())
+
+    values = np.full(
+        (
+            len(industry),
+            len(age_bracket),
+            int(tenure.max()) - tenure0 + 1,
+            int(years.max()) - year0 + 1
+        ),
+        np.nan
+    )
+
+    rows = [
+        _key_positions(df["Industry"], industry),
+        _key_positions(df["Age_Bracket"], age_bracket),
+        tenure - tenure0
+    ]
+
+    # Wide rows broadcast over their year columns
+    if "Year" not in df.columns:
+        rows = [r[:, None] for r in rows]
+
+    values[(*rows, year - year0)] = points
+
+    return {
+        "industry": industry,
+        "age_bracket": age_bracket,
+        "tenure0": tenure0,
+        "year0": year0,
+        "values": values
+    }
+
+
+def panel_gather(panel, df):
+    """
+    Panel value for every (Industry, Age_Bracket, Tenure, Year) row
+    of df, NaN where the panel has no such key.
+    """
+    values = panel["values"]
+
+    i = _key_positions(df["Industry"], panel["industry"])
+    a = _key_positions(df["Age_Bracket"], panel["age_bracket"])
+    t = df["Tenure"].to_numpy() - panel["tenure0"]
+    y = df["Year"].to_numpy() - panel["year0"]
+
+    found = (
+        (i >= 0) & (a >= 0)
+        & (t >= 0) & (t < values.shape[2])
+        & (y >= 0) & (y < values.shape[3])
+    )
+
+    out = np.full(len(df), np.nan)
+    out[found] = values[i[found], a[found], t[found], y[found]]
+
+    return out
+
+
+def attach_salary_to_survival(
+    survival_template_df,
+    salary_forecast_df
+):
+    """
+    Adds the forecast Salary for each template row's
+    (Industry, Age_Bracket, Tenure, Year); NaN where there is none.
+    """
+    surv = survival_template_df.reset_index(drop=True)
+    surv.columns = surv.columns.str.strip()
+
+    surv["Salary"] = panel_gather(
+        forecast_panel(salary_forecast_df, "Salary", "Salary"),
+        surv
+    )
+
+    return surv
+
+
+def attach_employees_to_survival(
+    survival_template_df,
+    employee_forecast_df
+):
+    """
+    Adds the forecast Employees for each template row's
+    (Industry, Age_Bracket, Tenure, Year); only positive
+    headcounts are attached, every other row gets 0.
+    """
+    surv = survival_template_df.reset_index(drop=True)
+    surv.columns = surv.columns.str.strip()
+
+    employees = panel_gather(
+        forecast_panel(employee_forecast_df, "Employees", "Emp"),
+        surv
+    )
+
+    surv["Employees"] = np.where(employees > 0, employees, 0.0)
+
+    return surv
+
+
+def prune_empty_cohorts(survival_with_employees_df, start_year=2025):
+    """
+    Drops the rows of cohorts that can never hold members, so the
+    survival engine does not sweep them. Output totals are unchanged.
+
+    Existing start_year cohorts (initial tenure > 0) only ever hold
+    their entry headcount. New-entrant cohorts also receive
+    replacements through the exit_pool, which needs members in their
+    Industry × Age_Bracket block in an earlier year; they are kept
+    from the year after the block's first staffed entry.
+
+    Expects the output of attach_employees_to_survival and logs the
+    fraction of rows pruned.
+    """
+    if survival_with_employees_df.empty:
+        return survival_with_employees_df
+
+    df = survival_with_employees_df.rename(columns=lambda c: c.strip())
+
+    block_keys = ["Industry", "Age_Bracket"]
+
+    block = df.groupby(block_keys, sort=False, observed=True).ngroup().to_numpy()
+    cohort = df.groupby(
+        block_keys + ["cohort"], sort=False, observed=True
+    ).ngroup().to_numpy()
+
+    start, initial_tenure = decode_cohort(df["cohort"].to_numpy())
+
+    staffed = (
+        (df["Year"].to_numpy() == start)
+        & (df["Employees"].to_numpy() > 0)
+    )
+
+    cohort_staffed = np.zeros(cohort.max() + 1, dtype=bool)
+    cohort_staffed[cohort[staffed]] = True
+
+    first_staffed = np.full(block.max() + 1, np.iinfo(np.int64).max)
+    np.minimum.at(first_staffed, block[staffed], start[staffed])
+
+    existing = (start == start_year) & (initial_tenure > 0)
+
+    keep = cohort_staffed[cohort] | (
+        ~existing & (start > first_staffed[block])
+    )
+
+    logger.info(
+        "Pruned %.1f%% of survival rows (%d of %d): cohorts that never hold members",
+        100 * (1 - keep.mean()),
+        int((~keep).sum()),
+        len(keep)
+    )
+
+    return survival_with_employees_df[keep].reset_index(drop=True)
+
+
+def attach_exit_and_replacement(
+    survival_with_employees_df,
+    merged_industry_df,
+    end_year=2040
+):
+    # Assumes DataFrames are already provided
+    surv = survival_with_employees_df.copy(deep=False)
+    rates = merged_industry_df.copy(deep=False)
+
+    # --------------------------------
+    # 1. Standardize column names
+    # --------------------------------
+    surv.columns = surv.columns.str.strip()
+    rates.columns = rates.columns.str.strip()
+
+    # Align naming
+    rates = rates.rename(columns={
+        "Industry": "industry",
+        "Age_Bracket": "age_bracket",
+        "Total Exit (q)": "exit_rate",
+        "Replacement Hiring %": "replacement_rate"
+    })
+
+    surv.columns = surv.columns.str.strip().str.lower()
+
+    # Lowercase for safe matching
+    surv["industry"] = normalize_key(surv["industry"])
+    surv["age_bracket"] = normalize_key(surv["age_bracket"])
+
+    rates["industry"] = align_key(normalize_key(rates["industry"]), surv["industry"])
+    rates["age_bracket"] = align_key(normalize_key(rates["age_bracket"]), surv["age_bracket"])
+
+    # --------------------------------
+    # 2. Merge Rates
+    # --------------------------------
+    updated = surv.merge(
+        rates[["industry", "age_bracket", "exit_rate", "replacement_rate"]],
+        on=["industry", "age_bracket"],
         how="left"
     )
 
-    # ==========================================================
-    # BASE YEAR
-    # ==========================================================
-    df[f"Emp_{start_year}"] = df["Employees"]
-    df[f"Salary_{start_year}"] = df["Average_Base_Salary"]
+    # --------------------------------
+    # 3. Override Replacement Logic
+    # --------------------------------
+    override_groups = ["<55", "55-59","60-64","65-69","70+"]
 
-    # ==========================================================
-    # EMPLOYEE FORECAST
-    # ==========================================================
-    tenure0_mask = df["Tenure"] == 0
-    non_tenure0_mask = ~tenure0_mask
+    updated.loc[
+        updated["age_bracket"].isin(override_groups),
+        "replacement_rate"
+    ] = updated["exit_rate"]
+
+    # --------------------------------
+    # 4. Add Exit Mapping Columns
+    # --------------------------------
+    updated["exit_year"] = np.where(updated["year"] < end_year, updated["year"] + 1, np.nan)
+    updated["exit_tenure"] = 0
+
+    return updated
+
+
+
+# Age brackets where every exit is replaced one-for-one
+FULL_REPLACEMENT_AGE_BRACKETS = ["<55", "55-59", "60-64", "65-69", "70+"]
+
+SURVIVAL_ENGINES = ("vectorized", "loop")
+
+
+def _gratuity_rate(tenure):
+    if tenure < 1:
+        return 0.0
+    elif tenure <= 5:
+        return tenure * 0.05833
+    elif tenure < 25:
+        return (5 * 0.05833) + ((tenure - 5) * 0.08333)
+    else:
+        return (5 * 0.05833) + ((25 - 5) * 0.08333)
+
+
+def _gratuity_rate_array(tenure):
+    """
+    Array version of _gratuity_rate (same arithmetic per element).
+    """
+    tenure = np.asarray(tenure)
+
+    return np.select(
+        [tenure < 1, tenure <= 5, tenure < 25],
+        [
+            0.0,
+            tenure * 0.05833,
+            (5 * 0.05833) + ((tenure - 5) * 0.08333)
+        ],
+        default=(5 * 0.05833) + ((25 - 5) * 0.08333)
+    )
+
+
+def _fund_engine_loop(g, fund_return_rate, ter_rate, start_year):
+    """
+    Row-by-row fund roll-forward for a single cohort (sorted by year).
+    Fills the with/without-return fund columns and ter_cost in place.
+    """
+    g["opening_fund_no_return"] = 0.0
+    g["closing_fund_no_return"] = 0.0
+    g["exit_payout_no_return"] = 0.0
 
-    df[f"Emp_{start_year}_cum"] = df[f"Emp_{start_year}"]
+    g["opening_fund_with_return"] = 0.0
+    g["fund_return"] = 0.0
+    g["closing_fund_with_return"] = 0.0
+    g["exit_payout_with_return"] = 0.0
 
-    for year in range(start_year + 1, end_year + 1):
+    fund_nr = 0.0
+    fund_wr = 0.0
 
-        prev = year - 1
+    for idx in g.index:
 
-        df.loc[tenure0_mask, f"Emp_{year}_cum"] = (
-            df.loc[tenure0_mask, f"Emp_{prev}_cum"]
-            * (1 + df.loc[tenure0_mask, "Expansion Hiring %"])
+        year = g.loc[idx, "year"]
+        contribution = g.loc[idx, "fund_contribution"]
+        exit_emp = g.loc[idx, "exit_employee"]
+
+        opening_members = (
+            g.loc[idx, "survived_employee"] +
+            g.loc[idx, "exit_employee"]
         )
 
-        df.loc[non_tenure0_mask, f"Emp_{year}_cum"] = 0
+        if year == start_year:
+            contribution_for_fund = 0.0
+            apply_return = False
+        else:
+            contribution_for_fund = contribution
+            apply_return = True
+
+        # -----------------------
+        # WITHOUT RETURN
+        # -----------------------
+        opening_nr = fund_nr
+        fund_before_exit_nr = opening_nr + contribution_for_fund
+
+        if opening_members > 0:
+            asset_per_employee_nr = fund_before_exit_nr / opening_members
+        else:
+            asset_per_employee_nr = 0.0
+
+        exit_payout_nr = exit_emp * asset_per_employee_nr
+        fund_nr = fund_before_exit_nr - exit_payout_nr
+
+        # -----------------------
+        # WITH RETURN
+        # -----------------------
+        opening_wr = fund_wr
+        fund_before_exit_wr = opening_wr + contribution_for_fund
+
+        if opening_members > 0:
+            asset_per_employee_wr = fund_before_exit_wr / opening_members
+        else:
+            asset_per_employee_wr = 0.0
+
+        exit_payout_wr = exit_emp * asset_per_employee_wr
+        fund_after_exit_wr = fund_before_exit_wr - exit_payout_wr
+
+        if apply_return:
+            fund_return = fund_after_exit_wr * fund_return_rate
+            fund_after_return = fund_after_exit_wr + fund_return
+        else:
+            fund_return = 0.0
+            fund_after_return = fund_after_exit_wr
+
+        # ✅ TER deduction
+        ter_cost = fund_after_return * ter_rate
+        fund_wr = fund_after_return - ter_cost
+
+        # STORE
+        g.loc[idx, [
+            "opening_fund_no_return",
+            "exit_payout_no_return",
+            "closing_fund_no_return",
+            "opening_fund_with_return",
+            "fund_return",
+            "exit_payout_with_return",
+            "closing_fund_with_return",
+            "ter_cost"
+        ]] = [
+            opening_nr,
+            exit_payout_nr,
+            fund_nr,
+            opening_wr,
+            fund_return,
+            exit_payout_wr,
+            fund_wr,
+            ter_cost
+        ]
 
-    # ==========================================================
-    # SALARY FORECAST (MATRIX METHOD)
-    # ==========================================================
+    return g
+
+
+FUND_COLUMNS = [
+    "opening_fund_no_return",
+    "exit_payout_no_return",
+    "closing_fund_no_return",
+    "opening_fund_with_return",
+    "fund_return",
+    "exit_payout_with_return",
+    "closing_fund_with_return",
+    "ter_cost"
+]
+
+
+def _fund_kernel(
+    cohort_start,
+    year,
+    contribution,
+    survived,
+    exit_employee,
+    fund_return_rate,
+    ter_rate,
+    start_year
+):
+    """
+    Scalar fund roll-forward over contiguous cohort rows.
 
-    
+    Same arithmetic as _fund_engine_loop; the fund balances reset
+    wherever cohort_start is True. Compiled with numba when available.
+    Returns the FUND_COLUMNS arrays in order.
+    """
+    n = len(year)
+
+    opening_nr_out = np.zeros(n)
+    exit_payout_nr_out = np.zeros(n)
+    closing_nr_out = np.zeros(n)
+    opening_wr_out = np.zeros(n)
+    fund_return_out = np.zeros(n)
+    exit_payout_wr_out = np.zeros(n)
+    closing_wr_out = np.zeros(n)
+    ter_cost_out = np.zeros(n)
+
+    fund_nr = 0.0
+    fund_wr = 0.0
+
+    for i in range(n):
+
+        if cohort_start[i]:
+            fund_nr = 0.0
+            fund_wr = 0.0
+
+        exit_emp = exit_employee[i]
+        opening_members = survived[i] + exit_emp
+
+        if year[i] == start_year:
+            contribution_for_fund = 0.0
+            apply_return = False
+        else:
+            contribution_for_fund = contribution[i]
+            apply_return = True
+
+        # WITHOUT RETURN
+        opening_nr = fund_nr
+        fund_before_exit_nr = opening_nr + contribution_for_fund
+
+        if opening_members > 0:
+            asset_per_employee_nr = fund_before_exit_nr / opening_members
+        else:
+            asset_per_employee_nr = 0.0
+
+        exit_payout_nr = exit_emp * asset_per_employee_nr
+        fund_nr = fund_before_exit_nr - exit_payout_nr
+
+        # WITH RETURN
+        opening_wr = fund_wr
+        fund_before_exit_wr = opening_wr + contribution_for_fund
+
+        if opening_members > 0:
+            asset_per_employee_wr = fund_before_exit_wr / opening_members
+        else:
+            asset_per_employee_wr = 0.0
+
+        exit_payout_wr = exit_emp * asset_per_employee_wr
+        fund_after_exit_wr = fund_before_exit_wr - exit_payout_wr
+
+        if apply_return:
+            fund_return = fund_after_exit_wr * fund_return_rate
+            fund_after_return = fund_after_exit_wr + fund_return
+        else:
+            fund_return = 0.0
+            fund_after_return = fund_after_exit_wr
+
+        ter_cost = fund_after_return * ter_rate
+        fund_wr = fund_after_return - ter_cost
+
+        opening_nr_out[i] = opening_nr
+        exit_payout_nr_out[i] = exit_payout_nr
+        closing_nr_out[i] = fund_nr
+        opening_wr_out[i] = opening_wr
+        fund_return_out[i] = fund_return
+        exit_payout_wr_out[i] = exit_payout_wr
+        closing_wr_out[i] = fund_wr
+        ter_cost_out[i] = ter_cost
+
+    return (
+        opening_nr_out,
+        exit_payout_nr_out,
+        closing_nr_out,
+        opening_wr_out,
+        fund_return_out,
+        exit_payout_wr_out,
+        closing_wr_out,
+        ter_cost_out
+    )
 
-    years = list(range(start_year, end_year + 1))
-    salary_cols = [f"Salary_{y}" for y in years]
 
-    df = df.sort_values(["Industry", "Age_Brackets", "Tenure"])
+if NUMBA_AVAILABLE:
+    # nogil: cohort chunks can run on parallel threads
+    _fund_kernel_compiled = njit(cache=True, nogil=True)(_fund_kernel)
 
-    for (ind, age), g in df.groupby(["Industry", "Age_Brackets"]):
 
-        g = g.sort_values("Tenure")
-        idx = g.index
-        horizontal_growth = 1 + g["Salary Growth %"].iloc[0]
-        diagonal_growth = 1 + g["Salary Growth %"].iloc[0]
-        print(f"Using horizontal growth: {horizontal_growth:.4f}, diagonal growth: {diagonal_growth:.4f}")
+def _cohort_positions(cohort_start):
+    """
+    Cohort id and position-within-cohort for contiguous cohort rows.
+    """
+    cohort_id = np.cumsum(cohort_start) - 1
+    offsets = np.flatnonzero(cohort_start)
+    position = np.arange(len(cohort_start)) - offsets[cohort_id]
+
+    return cohort_id, position
+
+
+def _fund_kernel_numpy(
+    cohort_start,
+    year,
+    contribution,
+    survived,
+    exit_employee,
+    fund_return_rate,
+    ter_rate,
+    start_year
+):
+    """
+    Pure-NumPy fallback for _fund_kernel.
 
-        n_tenure = len(g)
-        n_years = len(years)
+    Steps through the position within each cohort (at most one step
+    per projection year) and rolls every cohort forward at once.
+    """
+    n = len(year)
+    out = tuple(np.zeros(n) for _ in FUND_COLUMNS)
+
+    if n == 0:
+        return out
+
+    (
+        opening_nr_out,
+        exit_payout_nr_out,
+        closing_nr_out,
+        opening_wr_out,
+        fund_return_out,
+        exit_payout_wr_out,
+        closing_wr_out,
+        ter_cost_out
+    ) = out
+
+    cohort_id, position = _cohort_positions(cohort_start)
+
+    fund_nr = np.zeros(cohort_id[-1] + 1)
+    fund_wr = np.zeros(cohort_id[-1] + 1)
+
+    for k in range(position.max() + 1):
+
+        rows = np.flatnonzero(position == k)
+        c = cohort_id[rows]
+
+        exit_emp = exit_employee[rows]
+        opening_members = survived[rows] + exit_emp
+        has_members = opening_members > 0
+
+        apply_return = year[rows] != start_year
+        contribution_for_fund = np.where(
+            apply_return, contribution[rows], 0.0
+        )
+
+        # WITHOUT RETURN
+        opening_nr = fund_nr[c]
+        fund_before_exit_nr = opening_nr + contribution_for_fund
+
+        asset_per_employee_nr = np.divide(
+            fund_before_exit_nr,
+            opening_members,
+            out=np.zeros(len(rows)),
+            where=has_members
+        )
 
-        matrix = np.zeros((n_tenure, n_years))
+        exit_payout_nr = exit_emp * asset_per_employee_nr
+        fund_nr[c] = fund_before_exit_nr - exit_payout_nr
+
+        # WITH RETURN
+        opening_wr = fund_wr[c]
+        fund_before_exit_wr = opening_wr + contribution_for_fund
+
+        asset_per_employee_wr = np.divide(
+            fund_before_exit_wr,
+            opening_members,
+            out=np.zeros(len(rows)),
+            where=has_members
+        )
+
+        exit_payout_wr = exit_emp * asset_per_employee_wr
+        fund_after_exit_wr = fund_before_exit_wr - exit_payout_wr
+
+        fund_return = np.where(
+            apply_return, fund_after_exit_wr * fund_return_rate, 0.0
+        )
+        fund_after_return = np.where(
+            apply_return, fund_after_exit_wr + fund_return, fund_after_exit_wr
+        )
+
+        ter_cost = fund_after_return * ter_rate
+        fund_wr[c] = fund_after_return - ter_cost
+
+        opening_nr_out[rows] = opening_nr
+        exit_payout_nr_out[rows] = exit_payout_nr
+        closing_nr_out[rows] = fund_nr[c]
+        opening_wr_out[rows] = opening_wr
+        fund_return_out[rows] = fund_return
+        exit_payout_wr_out[rows] = exit_payout_wr
+        closing_wr_out[rows] = fund_wr[c]
+        ter_cost_out[rows] = ter_cost
+
+    return out
+
+
+def _chunk_bounds(starts, n_rows, n_chunks):
+    """
+    (lo, hi) row ranges splitting n_rows into at most n_chunks
+    contiguous chunks, cut only at the given (sorted) start rows.
+    """
+    if n_chunks <= 1 or len(starts) == 0:
+        return [(0, n_rows)]
+
+    targets = np.linspace(0, n_rows, n_chunks + 1)[1:-1]
+    cuts = starts[
+        np.minimum(np.searchsorted(starts, targets), len(starts) - 1)
+    ]
+    edges = np.unique(np.concatenate([[0], cuts, [n_rows]]))
+
+    return list(zip(edges[:-1], edges[1:]))
+
+
+def _map_chunks(fn, chunks, workers):
+    """
+    fn over chunks, on a thread pool when workers > 1.
+    Results come back in chunk order.
+    """
+    if workers <= 1 or len(chunks) <= 1:
+        return [fn(chunk) for chunk in chunks]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(fn, chunks))
+
+
+def fund_roll_forward(
+    cohort_start,
+    year,
+    contribution,
+    survived,
+    exit_employee,
+    fund_return_rate=0.08,
+    ter_rate=0.01,
+    start_year=2025,
+    use_numba=None,
+    workers=1
+):
+    """
+    Fund roll-forward for all cohorts in one call.
+
+    Rows must be grouped by cohort and sorted by year within each
+    cohort; cohort_start marks the first row of every cohort.
+
+    Returns a dict of the eight FUND_COLUMNS arrays. Uses the numba
+    kernel when numba is installed (use_numba=None), otherwise the
+    pure-NumPy fallback. With workers > 1 the cohorts are split into
+    chunks rolled forward on parallel threads (the numba kernel
+    releases the GIL); the result does not depend on workers.
+    """
+    if use_numba is None:
+        use_numba = NUMBA_AVAILABLE
+
+    if use_numba and not NUMBA_AVAILABLE:
+        raise ImportError("numba is not installed.")
+
+    kernel = _fund_kernel_compiled if use_numba else _fund_kernel_numpy
+
+    cohort_start = np.ascontiguousarray(cohort_start, dtype=np.bool_)
+    inputs = (
+        cohort_start,
+        np.ascontiguousarray(year, dtype=np.int64),
+        np.ascontiguousarray(contribution, dtype=np.float64),
+        np.ascontiguousarray(survived, dtype=np.float64),
+        np.ascontiguousarray(exit_employee, dtype=np.float64)
+    )
+
+    def roll(bounds):
+        lo, hi = bounds
+        return kernel(
+            *(values[lo:hi] for values in inputs),
+            float(fund_return_rate),
+            float(ter_rate),
+            int(start_year)
+        )
+
+    chunks = _chunk_bounds(
+        np.flatnonzero(cohort_start), len(cohort_start), workers
+    )
+    parts = _map_chunks(roll, chunks, workers)
+
+    if len(parts) == 1:
+        arrays = parts[0]
+    else:
+        arrays = [np.concatenate(column) for column in zip(*parts)]
+
+    return dict(zip(FUND_COLUMNS, arrays))
+
+
+def _add_exit_adjusted_liability(g):
+    # Remaining active members after exit
+    g["remaining_members"] = g["survived_employee"]
+
+    # Liability only for active members
+    g["exit_adjusted_liability"] = (
+        g["remaining_members"] *
+        g["gratuity_per_employee"]
+    )
+
+    # Funding gap WITHOUT return
+    g["fund_gap_exit_adj_no_return"] = (
+        g["exit_adjusted_liability"] -
+        g["closing_fund_no_return"]
+    )
+
+    # Funding gap WITH return
+    g["fund_gap_exit_adj_with_return"] = (
+        g["exit_adjusted_liability"] -
+        g["closing_fund_with_return"]
+    )
+
+    return g
+
+
+def _survival_order(df, start_year):
+    """
+    Row order the survival engine processes:
+    industry, age_bracket, phase, cohort, year.
 
-        # First column
-        matrix[:, 0] = g[f"Salary_{start_year}"].values
+    Phase 0 holds the existing start_year cohorts (tenure > 0),
+    which only emit exits. Phase 1 holds the new-entrant cohorts,
+    which can receive replacement inflows from the exit_pool.
 
-        # First row horizontal
-        for j in range(1, n_years):
-            matrix[0, j] = matrix[0, j-1] * horizontal_growth
+    Only the key columns are sorted; returns the row positions and
+    the phase of each ordered row.
+    """
+    cohort_keys = ["industry", "age_bracket", "cohort"]
 
-        # Diagonal propagation
-        for i in range(1, n_tenure):
-            for j in range(1, n_years):
-                matrix[i, j] = matrix[i-1, j-1] * diagonal_growth
+    keys = df[cohort_keys + ["year", "tenure"]].reset_index(drop=True)
+    keys = keys.sort_values(cohort_keys + ["year"])
 
-        df.loc[idx, salary_cols] = matrix
+    grouped = keys.groupby(cohort_keys, sort=False, observed=True)
+    first_year = grouped["year"].transform("first")
+    first_tenure = grouped["tenure"].transform("first")
 
-    # ==========================================================
-    # CONVERT EMPLOYEES TO INCREMENTAL
-    # ==========================================================
+    keys["_phase"] = np.where(
+        (first_year == start_year) & (first_tenure > 0), 0, 1
+    )
 
-    df[f"Emp_{start_year}"] = df[f"Emp_{start_year}_cum"]
+    keys = keys.sort_values(
+        ["industry", "age_bracket", "_phase", "cohort", "year"],
+        kind="stable"
+    )
 
-    for year in range(start_year + 1, end_year + 1):
+    return keys.index.to_numpy(), keys["_phase"].to_numpy()
+
+
+def _survival_matrix(
+    block,
+    cohort_pos,
+    year_idx,
+    years,
+    employees,
+    tenure,
+    exit_rate,
+    replacement_rate,
+    exit_year,
+    exit_tenure,
+    existing_cohort,
+    full_replacement
+):
+    """
+    Survival engine on a dense (block × cohort × year) layout.
 
-        prev = year - 1
+    block / cohort_pos / year_idx give each row's position in the
+    matrix (cohorts numbered in processing order within each block).
+    existing_cohort flags rows of phase-0 cohorts and full_replacement
+    flags blocks whose exits are replaced one-for-one.
 
-        df[f"Emp_{year}"] = (
-            df[f"Emp_{year}_cum"]
-            - df[f"Emp_{prev}_cum"]
-        )
+    Exits are resolved year by year for all blocks and cohorts at once:
+    exits at year j feed the exit_pool key (exit_year, exit_tenure) of
+    year j - 1, which is read by the cohorts entering at year j.
+    exit_year must be the next projection year (or NaN), as set by
+    attach_exit_and_replacement.
 
-    emp_cols = [f"Emp_{y}" for y in range(start_year, end_year + 1)]
+    Returns survived_employee and exit_employee per row.
+    """
+    n_blocks = block.max() + 1
+    n_cohorts = cohort_pos.max() + 1
+    n_years = len(years)
+    shape = (n_blocks, n_cohorts, n_years)
 
-    df.loc[non_tenure0_mask, emp_cols[1:]] = 0
+    def dense(values, fill):
+        out = np.full(shape, fill, dtype=float)
+        out[block, cohort_pos, year_idx] = values
+        return out
 
-    df.drop(columns=[c for c in df.columns if c.endswith("_cum")], inplace=True)
+    present = np.zeros(shape, dtype=bool)
+    present[block, cohort_pos, year_idx] = True
 
-    employee_agg = df[["Industry","Age_Brackets","Tenure"] + emp_cols]
-    salary_agg = df[["Industry","Age_Brackets","Tenure"] + salary_cols]
+    emp = dense(employees, 0.0)
+    ten = dense(tenure, -1.0)
+    q = dense(exit_rate, 0.0)
+    rr = dense(replacement_rate, 0.0)
+    ey = dense(exit_year, np.nan)
+    et = dense(exit_tenure, np.nan)
 
-    if save_output:
+    existing = np.zeros((n_blocks, n_cohorts), dtype=bool)
+    existing[block, cohort_pos] = existing_cohort
 
-        if employee_output_path:
-            employee_agg.to_excel(employee_output_path, index=False)
+    full_replacement = np.asarray(full_replacement, dtype=bool)[:, None]
 
-        if salary_output_path:
-            salary_agg.to_excel(salary_output_path, index=False)
+    survived = np.zeros(shape)
+    exited = np.zeros(shape)
+    started = np.zeros((n_blocks, n_cohorts), dtype=bool)
 
-    return employee_agg, salary_agg
+    for j in range(n_years):
 
-def generate_survival_template_cohort_style(
-    meta_info_df,
-    start_year=2025,
-    end_year=2040
-):
-    """
-    Creates survival template in cohort format + extra fixed 2025 cohort block.
-    Structure 1:
-        Normal yearly cohorts (2025_0, 2026_0, ...)
-    Structure 2:
-        Fixed 2025 starting cohort
-        Tenure starts from 1 and increases every year
-    """
-    # Assumes meta_info_df is already a DataFrame
-    df_raw = meta_info_df.copy()
-    df_raw.columns = df_raw.columns.str.strip()
-    industries = df_raw["Industry"].dropna().unique()
-    age_bracket = df_raw["Age_Bracket"].dropna().unique()
-    projection_years = range(start_year, end_year + 1)
-    records = []
+        now = present[:, :, j]
+        new = now & ~started
+        cont = now & started
 
-    # ----------------------------------------------------------
-    # 2. ORIGINAL COHORT STRUCTURE (UNCHANGED)
-    # ----------------------------------------------------------
-    for ind in industries:
-        for age in age_bracket:
+        # --------------------------------------------------
+        # CONTINUING COHORTS
+        # --------------------------------------------------
+        if j > 0 and cont.any():
 
-            for cohort_start in projection_years:
+            prev_surv = survived[:, :, j - 1]
+            q_prev = q[:, :, j - 1]
 
-                cohort_name = f"{cohort_start}_0"
+            surv_j = np.round(prev_surv * (1 - q_prev), 2)
+            exit_j = np.round(prev_surv * q_prev, 2)
 
-                for year in projection_years:
+            replacement = np.where(
+                full_replacement,
+                exit_j,
+                np.round(exit_j * rr[:, :, j - 1], 2)
+            )
 
-                    if year >= cohort_start:
+            survived[:, :, j] = np.where(cont, surv_j, 0.0)
+            exited[:, :, j] = np.where(cont, exit_j, 0.0)
 
-                        tenure = year - cohort_start
+            feeds_pool = cont & (ey[:, :, j - 1] == years[j])
+        else:
+            replacement = np.zeros((n_blocks, n_cohorts))
+            feeds_pool = np.zeros((n_blocks, n_cohorts), dtype=bool)
 
-                        records.append([
-                            ind,
-                            age,
-                            cohort_name,
-                            year,
-                            tenure
-                        ])
+        # --------------------------------------------------
+        # ENTERING COHORTS
+        # --------------------------------------------------
+        survived[:, :, j] = np.where(new, emp[:, :, j], survived[:, :, j])
 
-    max_initial_tenure = df_raw["Tenure"].max()
+        receives = new & ~existing
 
-    for ind in industries:
-        for age in age_bracket:
+        if receives.any():
 
-            for initial_tenure in range(1, int(max_initial_tenure) + 1):
+            for t0 in np.unique(ten[:, :, j][receives]):
 
-                cohort_name = f"{start_year}_{initial_tenure}"
+                # Cumulative sum along the cohort axis adds the
+                # replacements in processing order, like exit_pool
+                contrib = np.where(
+                    feeds_pool & (et[:, :, max(j - 1, 0)] == t0),
+                    replacement,
+                    0.0
+                )
+                inflow = np.cumsum(contrib, axis=1)[:, -1]
 
-                for year in projection_years:
+                target = receives & (ten[:, :, j] == t0)
 
-                    tenure = initial_tenure + (year - start_year)
+                survived[:, :, j] = np.where(
+                    target,
+                    emp[:, :, j] + inflow[:, None],
+                    survived[:, :, j]
+                )
 
-                    records.append([
-                        ind,
-                        age,
-                        cohort_name,
-                        year,
-                        tenure
-                    ])
+        started |= now
 
-    survival_template = pd.DataFrame(
-        records,
-        columns=[
-            "Industry",
-            "Age_Bracket",
-            "cohort",
-            "Year",
-            "Tenure"
-        ]
+    return (
+        survived[block, cohort_pos, year_idx],
+        exited[block, cohort_pos, year_idx]
     )
 
-    survival_template = survival_template.sort_values(
-        ["Industry", "Age_Bracket", "cohort", "Year"]
-    ).reset_index(drop=True)
-
-    return survival_template
 
+def _survival_ledger_vectorized(df, start_year, pos, workers=1):
+    order, phase = _survival_order(df, start_year)
 
-def attach_salary_to_survival(
-    survival_template_df,
-    salary_forecast_df
-):
-    # Assumes DataFrames are already provided
-    surv = survival_template_df.copy()
-    sal = salary_forecast_df.copy()
+    # The only full-frame copy: gather rows in processing order
+    df = df.take(order)
+    df.index = pd.RangeIndex(len(df))
 
-    # ----------------------------
-    # 1. Standardize column names
-    # ----------------------------
-    surv.columns = surv.columns.str.strip()
-    sal.columns = sal.columns.str.strip()
+    block = df.groupby(
+        ["industry", "age_bracket"],
+        sort=False,
+        observed=True
+    ).ngroup().to_numpy()
 
-    sal = sal.rename(columns={
-        "Age_Brackets": "Age_Bracket"
-    })
+    cohort_start = ~df.duplicated(["industry", "age_bracket", "cohort"])
+    cohort_pos = (
+        cohort_start.groupby(block).cumsum().to_numpy() - 1
+    )
 
-    # ----------------------------
-    # 2. Melt salary wide → long
-    # ----------------------------
-    salary_cols = [c for c in sal.columns if c.startswith("Salary_")]
+    year = df["year"].to_numpy()
+    years = np.arange(year.min(), year.max() + 1)
 
-    sal_long = sal.melt(
-        id_vars=["Industry", "Age_Bracket", "Tenure"],
-        value_vars=salary_cols,
-        var_name="Year",
-        value_name="Salary"
+    block_age = (
+        df.groupby(block, sort=False)["age_bracket"].first().astype(str)
     )
 
-    sal_long["Year"] = sal_long["Year"].str.extract(r"(\d+)").astype(int)
+    full_replacement = block_age.isin(
+        FULL_REPLACEMENT_AGE_BRACKETS
+    ).to_numpy()
+
+    row_inputs = {
+        "cohort_pos": cohort_pos,
+        "year_idx": year - years[0],
+        "employees": df["employees"].to_numpy(dtype=float),
+        "tenure": df["tenure"].to_numpy(dtype=float),
+        "exit_rate": df["exit_rate"].to_numpy(dtype=float),
+        "replacement_rate": df["replacement_rate"].to_numpy(dtype=float),
+        "exit_year": df["exit_year"].to_numpy(dtype=float),
+        "exit_tenure": df["exit_tenure"].to_numpy(dtype=float),
+        "existing_cohort": phase == 0
+    }
 
-    # ----------------------------
-    # 3. Merge with survival
-    # ----------------------------
-    merged = surv.merge(
-        sal_long,
-        on=["Industry", "Age_Bracket", "Tenure", "Year"],
-        how="left"
+    # Blocks are independent and contiguous: each chunk of blocks
+    # is swept on its own thread (NumPy releases the GIL)
+    def sweep(bounds):
+        lo, hi = bounds
+        first_block = block[lo]
+
+        return _survival_matrix(
+            block=block[lo:hi] - first_block,
+            years=years,
+            full_replacement=full_replacement[first_block:block[hi - 1] + 1],
+            **{name: values[lo:hi] for name, values in row_inputs.items()}
+        )
+
+    chunks = _chunk_bounds(
+        np.flatnonzero(np.diff(block, prepend=-1)), len(df), workers
     )
+    parts = _map_chunks(sweep, chunks, workers)
 
-    return merged
-def attach_employees_to_survival(
-    survival_template_df,
-    employee_forecast_df
-):
-    # Assumes DataFrames are already provided
-    surv = survival_template_df.copy()
-    emp = employee_forecast_df.copy()
+    survived = np.concatenate([part[0] for part in parts])
+    exited = np.concatenate([part[1] for part in parts])
 
-    # ----------------------------
-    # 1. Standardize columns
-    # ----------------------------
-    surv.columns = surv.columns.str.strip()
-    emp.columns = emp.columns.str.strip()
+    df["survived_employee"] = survived
+    df["exit_employee"] = exited
 
-    emp = emp.rename(columns={
-        "Age_Brackets": "Age_Bracket"
-    })
+    # ==================================================
+    # GRATUITY CALCULATION
+    # ==================================================
+    df["gratuity_rate"] = _gratuity_rate_array(df["tenure"].to_numpy())
 
-    # ----------------------------
-    # 2. Melt employee wide → long
-    # ----------------------------
-    emp_cols = [c for c in emp.columns if c.startswith("Emp_")]
+    df["annual_salary"] = df["salary"] * 12
 
-    emp_long = emp.melt(
-        id_vars=["Industry", "Age_Bracket", "Tenure"],
-        value_vars=emp_cols,
-        var_name="Year",
-        value_name="Employees"
+    df["gratuity_per_employee"] = (
+        df["annual_salary"] * df["gratuity_rate"]
     )
 
-    emp_long["Year"] = emp_long["Year"].str.extract(r"(\d+)").astype(int)
+    # ==================================================
+    # LIABILITY
+    # ==================================================
+    df["opening_members"] = (
+        df["survived_employee"] +
+        df["exit_employee"]
+    )
 
-    # ----------------------------
-    # 3. Keep only non-zero employees
-    # ----------------------------
-    emp_long = emp_long[emp_long["Employees"] > 0]
+    df["total_liability"] = (
+        df["opening_members"] *
+        df["gratuity_per_employee"]
+    )
 
-    # ----------------------------
-    # 4. Merge into survival template
-    # ----------------------------
-    merged = surv.merge(
-        emp_long,
-        on=["Industry", "Age_Bracket", "Tenure", "Year"],
-        how="left"
+    previous_liability = (
+        df["total_liability"].shift(1).mask(cohort_start)
     )
 
-    # Replace missing with 0
-    merged["Employees"] = merged["Employees"].fillna(0)
+    df["fund_contribution"] = (
+        df["total_liability"] - previous_liability
+    ).fillna(df["total_liability"])
 
-    return merged
+    if pos:
+        df["fund_contribution"] = df["fund_contribution"].clip(lower=0)
 
+    return df
 
-def attach_exit_and_replacement(
-    survival_with_employees_df,
-    merged_industry_df
-):
-    # Assumes DataFrames are already provided
-    surv = survival_with_employees_df.copy()
-    rates = merged_industry_df.copy()
 
-    # --------------------------------
-    # 1. Standardize column names
-    # --------------------------------
-    surv.columns = surv.columns.str.strip()
-    rates.columns = rates.columns.str.strip()
+def run_survival_liability_model(
+    df,
+    start_year=2025,
+    pos=True,
+    workers=1
+):
+    """
+    Survival + EOSG liability at cohort-year level, without the fund.
 
-    # Align naming
-    rates = rates.rename(columns={
-        "Industry": "industry",
-        "Age_Bracket": "age_bracket",
-        "Total Exit (q)": "exit_rate",
-        "Replacement Hiring %": "replacement_rate"
-    })
+    Returns the cohort ledger (survivors, exits, gratuity, liability
+    and fund_contribution). It does not depend on the fund return or
+    TER, so it can be computed once and passed to run_fund_model for
+    each return / fee what-if.
 
-    surv.columns = surv.columns.str.strip().str.lower()
+    workers > 1 sweeps chunks of (industry, age_bracket) blocks on
+    parallel threads; the output does not depend on workers.
+    """
+    # Shallow: only the column labels change on this frame
+    df = df.copy(deep=False)
+    df.columns = df.columns.str.lower().str.strip()
 
-    # Lowercase for safe matching
-    surv["industry"] = surv["industry"].astype(str).str.strip().str.lower()
-    surv["age_bracket"] = surv["age_bracket"].astype(str).str.strip().str.lower()
+    return _survival_ledger_vectorized(df, start_year, pos, workers)
 
-    rates["industry"] = rates["industry"].astype(str).str.strip().str.lower()
-    rates["age_bracket"] = rates["age_bracket"].astype(str).str.strip().str.lower()
 
-    # --------------------------------
-    # 2. Merge Rates
-    # --------------------------------
-    updated = surv.merge(
-        rates[["industry", "age_bracket", "exit_rate", "replacement_rate"]],
-        on=["industry", "age_bracket"],
-        how="left"
+def run_fund_model(
+    ledger,
+    fund_return_rate=0.08,
+    ter_rate=0.01,
+    start_year=2025,
+    workers=1
+):
+    """
+    Fund roll-forward and exit-adjusted liability on a cohort ledger
+    from run_survival_liability_model. The ledger is not modified.
+    """
+    df = ledger.copy(deep=False)
+
+    cohort_start = ~df.duplicated(["industry", "age_bracket", "cohort"])
+
+    # ==================================================
+    # FUND ENGINE
+    # ==================================================
+    fund = fund_roll_forward(
+        cohort_start.to_numpy(),
+        df["year"].to_numpy(),
+        df["fund_contribution"].to_numpy(),
+        df["survived_employee"].to_numpy(),
+        df["exit_employee"].to_numpy(),
+        fund_return_rate=fund_return_rate,
+        ter_rate=ter_rate,
+        start_year=start_year,
+        workers=workers
     )
 
-    # --------------------------------
-    # 3. Override Replacement Logic
-    # --------------------------------
-    override_groups = ["<55", "55-59","60-64","65-69","70+"]
-
-    updated.loc[
-        updated["age_bracket"].isin(override_groups),
-        "replacement_rate"
-    ] = updated["exit_rate"]
+    df.insert(
+        df.columns.get_loc("exit_employee") + 1,
+        "ter_cost",
+        fund["ter_cost"]
+    )
 
-    # --------------------------------
-    # 4. Add Exit Mapping Columns
-    # --------------------------------
-    updated["exit_year"] = np.where(updated["year"] < 2040, updated["year"] + 1, np.nan)
-    updated["exit_tenure"] = 0
+    for col in [
+        "opening_fund_no_return",
+        "closing_fund_no_return",
+        "exit_payout_no_return",
+        "opening_fund_with_return",
+        "fund_return",
+        "closing_fund_with_return",
+        "exit_payout_with_return"
+    ]:
+        df[col] = fund[col]
 
-    return updated
+    # ==================================================
+    # EXIT-ADJUSTED LIABILITY
+    # ==================================================
+    df = _add_exit_adjusted_liability(df)
 
+    return df
 
 
 def run_full_survival_eosg_model(
@@ -553,12 +1796,43 @@ def run_full_survival_eosg_model(
     fund_return_rate=0.08,
     ter_rate=0.01,   # ✅ Added TER parameter
     start_year=2025,
-    pos=True
+    pos=True,
+    engine="vectorized",
+    workers=1
 ):
+    """
+    Survival + EOSG liability + fund engine at cohort-year level.
 
-    df = df.copy()
+    engine:
+        "vectorized" – survival/exit resolved on a dense
+                       (block × cohort × year) NumPy matrix
+        "loop"       – original row-by-row implementation
+
+    Both engines return the same columns, rows and row order. The
+    vectorized engine is run_survival_liability_model followed by
+    run_fund_model; workers (vectorized only) sets how many threads
+    they use.
+    """
+
+    if engine not in SURVIVAL_ENGINES:
+        raise ValueError(
+            f"Unknown survival engine '{engine}'. "
+            f"Expected one of {SURVIVAL_ENGINES}."
+        )
+
+    # Shallow: only the column labels change on this frame
+    df = df.copy(deep=False)
     df.columns = df.columns.str.lower().str.strip()
 
+    if engine == "vectorized":
+        return run_fund_model(
+            _survival_ledger_vectorized(df, start_year, pos, workers),
+            fund_return_rate=fund_return_rate,
+            ter_rate=ter_rate,
+            start_year=start_year,
+            workers=workers
+        )
+
     df = df.sort_values(
         ["industry", "age_bracket", "cohort", "year"]
     ).reset_index(drop=True)
@@ -567,16 +1841,14 @@ def run_full_survival_eosg_model(
 
     for (ind, age), block in df.groupby(
         ["industry", "age_bracket"],
-        sort=False
+        sort=False,
+        observed=True
     ):
 
         block = block.sort_values(["cohort", "year"])
         exit_pool = {}
 
-        cohort_groups = {
-            c: g.copy()
-            for c, g in block.groupby("cohort")
-        }
+        cohort_groups = dict(list(block.groupby("cohort")))
 
         phase1 = []
         phase2 = []
@@ -592,8 +1864,7 @@ def run_full_survival_eosg_model(
 
             for c in cohort_list:
 
-                g = cohort_groups[c].copy()
-                g = g.sort_values("year")
+                g = cohort_groups[c].sort_values("year")
 
                 g["survived_employee"] = 0.0
                 g["exit_employee"] = 0.0
@@ -626,7 +1897,7 @@ def run_full_survival_eosg_model(
                     survived = round(prev_surv * (1 - exit_rate), 2)
                     exit_emp = round(prev_surv * exit_rate, 2)
 
-                    if age in ["<55", "55-59","60-64","65-69","70+"]:
+                    if age in FULL_REPLACEMENT_AGE_BRACKETS:
                         replacement = exit_emp
                     else:
                         replacement = round(exit_emp * repl_rate, 2)
@@ -646,17 +1917,7 @@ def run_full_survival_eosg_model(
                 # ==================================================
                 # GRATUITY CALCULATION
                 # ==================================================
-                def gratuity_rate(tenure):
-                    if tenure < 1:
-                        return 0.0
-                    elif tenure <= 5:
-                        return tenure * 0.05833
-                    elif tenure < 25:
-                        return (5 * 0.05833) + ((tenure - 5) * 0.08333)
-                    else:
-                        return (5 * 0.05833) + ((25 - 5) * 0.08333)
-
-                g["gratuity_rate"] = g["tenure"].apply(gratuity_rate)
+                g["gratuity_rate"] = g["tenure"].apply(_gratuity_rate)
 
                 g["annual_salary"] = g["salary"] * 12
 
@@ -692,119 +1953,12 @@ def run_full_survival_eosg_model(
                 # ==================================================
                 # FUND ENGINE
                 # ==================================================
-                g["opening_fund_no_return"] = 0.0
-                g["closing_fund_no_return"] = 0.0
-                g["exit_payout_no_return"] = 0.0
-
-                g["opening_fund_with_return"] = 0.0
-                g["fund_return"] = 0.0
-                g["closing_fund_with_return"] = 0.0
-                g["exit_payout_with_return"] = 0.0
-
-                fund_nr = 0.0
-                fund_wr = 0.0
-
-                for idx in g.index:
-
-                    year = g.loc[idx, "year"]
-                    contribution = g.loc[idx, "fund_contribution"]
-                    exit_emp = g.loc[idx, "exit_employee"]
-
-                    opening_members = (
-                        g.loc[idx, "survived_employee"] +
-                        g.loc[idx, "exit_employee"]
-                    )
-
-                    if year == start_year:
-                        contribution_for_fund = 0.0
-                        apply_return = False
-                    else:
-                        contribution_for_fund = contribution
-                        apply_return = True
-
-                    # -----------------------
-                    # WITHOUT RETURN
-                    # -----------------------
-                    opening_nr = fund_nr
-                    fund_before_exit_nr = opening_nr + contribution_for_fund
-
-                    if opening_members > 0:
-                        asset_per_employee_nr = fund_before_exit_nr / opening_members
-                    else:
-                        asset_per_employee_nr = 0.0
-
-                    exit_payout_nr = exit_emp * asset_per_employee_nr
-                    fund_nr = fund_before_exit_nr - exit_payout_nr
-
-                    # -----------------------
-                    # WITH RETURN
-                    # -----------------------
-                    opening_wr = fund_wr
-                    fund_before_exit_wr = opening_wr + contribution_for_fund
-
-                    if opening_members > 0:
-                        asset_per_employee_wr = fund_before_exit_wr / opening_members
-                    else:
-                        asset_per_employee_wr = 0.0
+                g = _fund_engine_loop(g, fund_return_rate, ter_rate, start_year)
 
-                    exit_payout_wr = exit_emp * asset_per_employee_wr
-                    fund_after_exit_wr = fund_before_exit_wr - exit_payout_wr
-
-                    if apply_return:
-                        fund_return = fund_after_exit_wr * fund_return_rate
-                        fund_after_return = fund_after_exit_wr + fund_return
-                    else:
-                        fund_return = 0.0
-                        fund_after_return = fund_after_exit_wr
-
-                    # ✅ TER deduction
-                    ter_cost = fund_after_return * ter_rate
-                    fund_wr = fund_after_return - ter_cost
-
-                    # STORE
-                    g.loc[idx, [
-                        "opening_fund_no_return",
-                        "exit_payout_no_return",
-                        "closing_fund_no_return",
-                        "opening_fund_with_return",
-                        "fund_return",
-                        "exit_payout_with_return",
-                        "closing_fund_with_return",
-                        "ter_cost"
-                    ]] = [
-                        opening_nr,
-                        exit_payout_nr,
-                        fund_nr,
-                        opening_wr,
-                        fund_return,
-                        exit_payout_wr,
-                        fund_wr,
-                        ter_cost
-                    ]
                 # ==================================================
                 # EXIT-ADJUSTED LIABILITY
                 # ==================================================
-
-                # Remaining active members after exit
-                g["remaining_members"] = g["survived_employee"]
-
-                # Liability only for active members
-                g["exit_adjusted_liability"] = (
-                    g["remaining_members"] *
-                    g["gratuity_per_employee"]
-                )
-
-                # Funding gap WITHOUT return
-                g["fund_gap_exit_adj_no_return"] = (
-                    g["exit_adjusted_liability"] -
-                    g["closing_fund_no_return"]
-                )
-
-                # Funding gap WITH return
-                g["fund_gap_exit_adj_with_return"] = (
-                    g["exit_adjusted_liability"] -
-                    g["closing_fund_with_return"]
-                )
+                g = _add_exit_adjusted_liability(g)
 
                 final_blocks.append(g)
 
@@ -812,6 +1966,7 @@ def run_full_survival_eosg_model(
 
     return final_df
 
+
 def aggregate_industry_year_combined(df):
     """
     Cohort-first aggregation.
@@ -819,7 +1974,7 @@ def aggregate_industry_year_combined(df):
     then aggregated to Industry × Year.
     """
 
-    df = df.copy()
+    df = df.copy(deep=False)
 
     # ==========================================================
     # 1️⃣ COHORT-YEAR LEVEL CALCULATIONS
@@ -864,7 +2019,8 @@ def aggregate_industry_year_combined(df):
     # ==========================================================
     grouped = df.groupby(
         ["industry", "year"],
-        as_index=False
+        as_index=False,
+        observed=True
     ).agg(
         total_employees=("survived_employee", "sum"),
         exit_employee_total=("exit_employee", "sum"),
@@ -929,13 +2085,13 @@ def aggregate_industry_year_combined(df):
     )
 
     grouped["fund_added_no_return"] = (
-        grouped.groupby("industry")["closing_fund_no_return"]
+        grouped.groupby("industry", observed=True)["closing_fund_no_return"]
         .diff()
         .fillna(grouped["closing_fund_no_return"])
     )
 
     grouped["fund_added_with_return"] = (
-        grouped.groupby("industry")["closing_fund_with_return"]
+        grouped.groupby("industry", observed=True)["closing_fund_with_return"]
         .diff()
         .fillna(grouped["closing_fund_with_return"])
     )
@@ -944,13 +2100,13 @@ def aggregate_industry_year_combined(df):
     # 5️⃣ CONTINUITY CHECK (UNCHANGED)
     # ==========================================================
     grouped["continuity_check_no_return"] = (
-        grouped.groupby("industry")["opening_fund_no_return"]
+        grouped.groupby("industry", observed=True)["opening_fund_no_return"]
         .shift(-1)
         - grouped["closing_fund_no_return"]
     )
 
     grouped["continuity_check_with_return"] = (
-        grouped.groupby("industry")["opening_fund_with_return"]
+        grouped.groupby("industry", observed=True)["opening_fund_with_return"]
         .shift(-1)
         - grouped["closing_fund_with_return"]
     )
@@ -1028,24 +2184,17 @@ def apply_economic_impact_combined(
     Output structure remains unchanged.
     """
 
-    df = industry_year_df.copy()
-    econ = economic_df.copy()
+    df = industry_year_df.copy(deep=False)
+    econ = economic_df.copy(deep=False)
 
     # ==========================================================
     # 1. STANDARDIZE KEYS
     # ==========================================================
-    df["industry"] = (
-        df["industry"]
-        .astype(str)
-        .str.strip()
-        .str.lower()
-    )
+    df["industry"] = normalize_key(df["industry"])
 
-    econ["industry"] = (
-        econ["Industry"]
-        .astype(str)
-        .str.strip()
-        .str.lower()
+    econ["industry"] = align_key(
+        normalize_key(econ["Industry"]),
+        df["industry"]
     )
 
     # ==========================================================
@@ -1137,14 +2286,107 @@ def apply_economic_impact_combined(
 
     return df
 
+DEFAULT_SCENARIO_RETURN_RATES = (0.00, 0.02, 0.04, 0.06, 0.08, 0.12)
+
+
+def _scenario_labels(return_rates):
+    """
+    Column labels for a return grid: {"0": 0.0, "2": 0.02, ...}.
+    A dict is taken as an explicit label → rate mapping.
+    """
+    if isinstance(return_rates, dict):
+        return {str(k): float(v) for k, v in return_rates.items()}
+
+    return {
+        f"{round(r * 100, 6):g}": float(r)
+        for r in return_rates
+    }
+
+
+def _scenario_fund_matrix(
+    cohort_start,
+    year,
+    contribution,
+    survived,
+    exit_employee,
+    rates,
+    ter_rate,
+    start_year
+):
+    """
+    Closing fund balances for every row and every return rate,
+    as a (rows × n_rates) array.
+
+    All rates are rolled forward together, one position within the
+    cohort at a time.
+    """
+    n = len(year)
+    balances = np.zeros((n, len(rates)))
+
+    if n == 0:
+        return balances
+
+    cohort_id, position = _cohort_positions(cohort_start)
+    fund = np.zeros((cohort_id[-1] + 1, len(rates)))
+
+    for k in range(position.max() + 1):
+
+        rows = np.flatnonzero(position == k)
+        c = cohort_id[rows]
+
+        exit_emp = exit_employee[rows]
+        opening_members = survived[rows] + exit_emp
+
+        # POLICY: Fund starts from start_year + 1
+        apply_return = (year[rows] != start_year)[:, None]
+        contribution_for_fund = np.where(
+            apply_return[:, 0], contribution[rows], 0.0
+        )
+
+        # 1️⃣ Opening fund + 2️⃣ contribution
+        fund_before_exit = fund[c] + contribution_for_fund[:, None]
+
+        # 3️⃣ Pooled asset per employee
+        asset_per_employee = np.divide(
+            fund_before_exit,
+            opening_members[:, None],
+            out=np.zeros_like(fund_before_exit),
+            where=(opening_members > 0)[:, None]
+        )
+
+        # 4️⃣ Exit payout
+        exit_payout = exit_emp[:, None] * asset_per_employee
+        fund_after_exit = fund_before_exit - exit_payout
+
+        # 5️⃣ Return + TER (only after start_year)
+        fund_after_return = fund_after_exit * (1 + rates)
+        ter_cost = fund_after_return * ter_rate
+
+        fund[c] = np.where(
+            apply_return,
+            fund_after_return - ter_cost,
+            fund_after_exit
+        )
+
+        balances[rows] = fund[c]
+
+    return balances
+
+
 def generate_cohort_fund_scenarios(
     combined_df,
     start_year=2025,
-    ter_rate=0.01
+    ter_rate=0.01,
+    return_rates=DEFAULT_SCENARIO_RETURN_RATES
 ):
     """
-    Cohort-wise pooled fund simulation at:
-        0%, 4%, 6%, 8%
+    Cohort-wise pooled fund simulation over a grid of return rates
+    (default 0%, 2%, 4%, 6%, 8%, 12%).
+
+    return_rates may be any sequence of rates, or a dict of
+    label → rate. Each rate adds fund_<label> and
+    fund_<label>_exit_adj columns; all rates are computed in a
+    single pass.
 
     Policy:
         - No funding in start_year
@@ -1158,135 +2400,282 @@ def generate_cohort_fund_scenarios(
     Return applied AFTER exit payout.
     """
 
-    df = combined_df.copy()
-
-    df = df.sort_values(
+    df = combined_df.sort_values(
         ["industry", "age_bracket", "cohort", "year"]
+    ).reset_index(drop=True)
+
+    labels = _scenario_labels(return_rates)
+
+    cohort_start = ~df.duplicated(
+        ["industry", "age_bracket", "cohort"]
+    ).to_numpy()
+
+    balances = _scenario_fund_matrix(
+        cohort_start,
+        df["year"].to_numpy(),
+        df["fund_contribution"].to_numpy(dtype=float),
+        df["survived_employee"].to_numpy(dtype=float),
+        df["exit_employee"].to_numpy(dtype=float),
+        np.array(list(labels.values()), dtype=float),
+        ter_rate,
+        start_year
     )
 
-    result_blocks = []
+    final_df = df[[
+        "industry",
+        "age_bracket",
+        "cohort",
+        "year",
+        "tenure",
+        "survived_employee",
+        "exit_employee",
+        "fund_contribution"
+    ]]
 
-    return_rates = {
-        "0": 0.00,
-        "2": 0.02,
-        "4": 0.04,
-        "6": 0.06,
-        "8": 0.08,
-        "12": 0.12
-    }
+    fund_cols = [f"fund_{label}" for label in labels]
+
+    fund_df = pd.concat(
+        [
+            pd.DataFrame(balances, columns=fund_cols),
+            # kept for compatibility
+            pd.DataFrame(
+                balances,
+                columns=[f"{c}_exit_adj" for c in fund_cols]
+            )
+        ],
+        axis=1
+    )
 
-    for (ind, age, cohort), g in df.groupby(
-        ["industry", "age_bracket", "cohort"],
-        sort=False
-    ):
+    final_df = pd.concat([final_df, fund_df], axis=1)
 
-        g = g.sort_values("year").copy()
+    return final_df
 
-        for label, r in return_rates.items():
 
-            fund = 0.0
-            balances = []
+# ==========================================================
+# MONTE CARLO FUND RETURNS
+# ==========================================================
 
-            for _, row in g.iterrows():
+RETURN_PATH_METHODS = ("lognormal", "bootstrap")
 
-                year = row["year"]
-                contribution = row["fund_contribution"]
-                exit_emp = row["exit_employee"]
 
-                opening_members = (
-                    row["survived_employee"] +
-                    row["exit_employee"]
-                )
+def simulate_return_paths(
+    n_years,
+    n_paths=1000,
+    mean_return=0.08,
+    volatility=0.10,
+    method="lognormal",
+    history=None,
+    seed=None
+):
+    """
+    Annual fund return paths as an (n_years × n_paths) array.
 
-                # --------------------------------------------------
-                # POLICY: Fund starts from start_year + 1
-                # --------------------------------------------------
-                if year == start_year:
-                    contribution_for_fund = 0.0
-                    apply_return = False
-                else:
-                    contribution_for_fund = contribution
-                    apply_return = True
-
-                # ---------------------------------
-                # 1️⃣ Opening fund
-                # ---------------------------------
-                opening_fund = fund
-
-                # ---------------------------------
-                # 2️⃣ Add contribution
-                # ---------------------------------
-                fund_before_exit = (
-                    opening_fund + contribution_for_fund
-                )
+    method:
+        "lognormal" – gross return 1 + r is lognormal with mean
+                      1 + mean_return and standard deviation
+                      volatility
+        "bootstrap" – annual returns resampled with replacement
+                      from history
 
-                # ---------------------------------
-                # 3️⃣ Calculate pooled asset per employee
-                # ---------------------------------
-                if opening_members > 0:
-                    asset_per_employee = (
-                        fund_before_exit / opening_members
-                    )
-                else:
-                    asset_per_employee = 0.0
+    The same seed always gives the same paths.
+    """
+    if method not in RETURN_PATH_METHODS:
+        raise ValueError(
+            f"Unknown return path method '{method}'. "
+            f"Expected one of {RETURN_PATH_METHODS}."
+        )
 
-                # ---------------------------------
-                # 4️⃣ Exit payout
-                # ---------------------------------
-                exit_payout = exit_emp * asset_per_employee
+    rng = np.random.default_rng(seed)
 
-                fund_after_exit = (
-                    fund_before_exit - exit_payout
-                )
+    if method == "bootstrap":
+        if history is None or len(history) == 0:
+            raise ValueError("method='bootstrap' needs a history of returns.")
+
+        history = np.asarray(history, dtype=float)
+        return rng.choice(history, size=(n_years, n_paths), replace=True)
+
+    sigma = np.sqrt(np.log1p((volatility / (1 + mean_return)) ** 2))
+    mu = np.log1p(mean_return) - sigma ** 2 / 2
+
+    return np.exp(rng.normal(mu, sigma, size=(n_years, n_paths))) - 1
+
+
+def _monte_carlo_fund_matrix(
+    cohort_start,
+    year_idx,
+    apply_return,
+    contribution,
+    survived,
+    exit_employee,
+    path_returns,
+    ter_rate
+):
+    """
+    Closing fund balances for every row and every return path, as a
+    (rows × paths) array. path_returns is (n_years × paths), indexed
+    by year_idx.
+
+    Same roll-forward as fund_roll_forward, one position within the
+    cohort at a time for all cohorts and paths.
+    """
+    n = len(year_idx)
+    n_paths = path_returns.shape[1]
+    balances = np.zeros((n, n_paths))
+
+    if n == 0:
+        return balances
+
+    cohort_id, position = _cohort_positions(cohort_start)
+    fund = np.zeros((cohort_id[-1] + 1, n_paths))
+
+    for k in range(position.max() + 1):
+
+        rows = np.flatnonzero(position == k)
+        c = cohort_id[rows]
 
-                # ---------------------------------
-                # 5️⃣ Apply return (only after start_year)
-                # ---------------------------------
-                if apply_return:
-
-                    fund_after_return = fund_after_exit * (1 + r)
-
-                    ter_cost = fund_after_return * ter_rate
-
-                    fund = fund_after_return - ter_cost
-
-                else:
-                    fund = fund_after_exit
-                    ter_cost = 0.0
-
-                balances.append(fund)
-
-            g[f"fund_{label}"] = balances
-            g[f"fund_{label}_exit_adj"] = balances  # kept for compatibility
-
-        result_blocks.append(
-            g[[
-                "industry",
-                "age_bracket",
-                "cohort",
-                "year",
-                "tenure",
-                "survived_employee",
-                "exit_employee",
-                "fund_contribution",
-                "fund_0",
-                "fund_2",
-                "fund_4",
-                "fund_6",
-                "fund_8",
-                "fund_12",
-                "fund_0_exit_adj",
-                "fund_2_exit_adj",
-                "fund_4_exit_adj",
-                "fund_6_exit_adj",
-                "fund_8_exit_adj",
-                "fund_12_exit_adj"
-            ]]
+        exit_emp = exit_employee[rows]
+        opening_members = survived[rows] + exit_emp
+
+        applies = apply_return[rows]
+        contribution_for_fund = np.where(applies, contribution[rows], 0.0)
+
+        fund_before_exit = fund[c] + contribution_for_fund[:, None]
+
+        asset_per_employee = np.divide(
+            fund_before_exit,
+            opening_members[:, None],
+            out=np.zeros_like(fund_before_exit),
+            where=(opening_members > 0)[:, None]
         )
 
-    final_df = pd.concat(result_blocks).reset_index(drop=True)
+        fund_after_exit = fund_before_exit - exit_emp[:, None] * asset_per_employee
 
-    return final_df
+        fund_after_return = (
+            fund_after_exit + fund_after_exit * path_returns[year_idx[rows]]
+        )
+
+        fund[c] = np.where(
+            applies[:, None],
+            fund_after_return - fund_after_return * ter_rate,
+            fund_after_exit
+        )
+
+        balances[rows] = fund[c]
+
+    return balances
+
+
+def run_monte_carlo_fund(
+    ledger,
+    n_paths=1000,
+    mean_return=0.08,
+    volatility=0.10,
+    method="lognormal",
+    history=None,
+    ter_rate=0.01,
+    start_year=2025,
+    seed=None,
+    by=("industry",),
+    percentiles=(5, 50, 95),
+    max_chunk_mb=256
+):
+    """
+    Stochastic fund returns on top of a cohort ledger (from
+    run_survival_liability_model, or the combined output).
+
+    Survival, exits and contributions come from the ledger and are
+    not recomputed; only the fund roll-forward runs per path. Paths
+    are drawn up front (see simulate_return_paths) and rolled forward
+    in chunks of at most max_chunk_mb of row × path balances, so the
+    result does not depend on the chunk size.
+
+    Returns one row per `by` × year with the deterministic
+    exit_adjusted_liability and, for closing_fund and fund_gap
+    (exit-adjusted liability minus closing fund), the mean and the
+    requested percentiles (closing_fund_p5, ..., fund_gap_p95).
+    """
+    by = list(by)
+
+    df = ledger.sort_values(
+        ["industry", "age_bracket", "cohort", "year"]
+    ).reset_index(drop=True)
+
+    year = df["year"].to_numpy()
+    years = np.arange(start_year, year.max() + 1)
+
+    path_returns = simulate_return_paths(
+        len(years),
+        n_paths=n_paths,
+        mean_return=mean_return,
+        volatility=volatility,
+        method=method,
+        history=history,
+        seed=seed
+    )
+
+    # POLICY: no contribution and no return in start_year
+    year_idx = year - start_year
+    apply_return = year != start_year
+
+    cohort_start = ~df.duplicated(
+        ["industry", "age_bracket", "cohort"]
+    ).to_numpy()
+
+    contribution = df["fund_contribution"].to_numpy(dtype=float)
+    survived = df["survived_employee"].to_numpy(dtype=float)
+    exit_employee = df["exit_employee"].to_numpy(dtype=float)
+
+    liability = (
+        df["survived_employee"] * df["gratuity_per_employee"]
+    ).to_numpy(dtype=float)
+
+    # Rows grouped by (by, year) for the per-chunk sums
+    group = df.groupby(by + ["year"], observed=True).ngroup().to_numpy()
+    order = np.argsort(group, kind="stable")
+    group_start = np.flatnonzero(np.diff(group[order], prepend=-1))
+
+    # Sums skip missing rows, like aggregate_industry_year_combined
+    def total(values):
+        values = values[order]
+        values = np.where(np.isnan(values), 0.0, values)
+        return np.add.reduceat(values, group_start, axis=0)
+
+    liability_total = total(liability)
+    closing_fund = np.empty((len(group_start), n_paths))
+
+    chunk = max(1, int(max_chunk_mb * 1024 ** 2 // (8 * max(len(df), 1))))
+
+    for lo in range(0, n_paths, chunk):
+        hi = min(lo + chunk, n_paths)
+
+        balances = _monte_carlo_fund_matrix(
+            cohort_start,
+            year_idx,
+            apply_return,
+            contribution,
+            survived,
+            exit_employee,
+            path_returns[:, lo:hi],
+            ter_rate
+        )
+
+        closing_fund[:, lo:hi] = total(balances)
+
+    fund_gap = liability_total[:, None] - closing_fund
+
+    result = (
+        df.iloc[order[group_start]][by + ["year"]]
+        .reset_index(drop=True)
+    )
+    result["exit_adjusted_liability"] = liability_total
+
+    for name, samples in [("closing_fund", closing_fund), ("fund_gap", fund_gap)]:
+        result[f"{name}_mean"] = samples.mean(axis=1)
+
+        for q in percentiles:
+            result[f"{name}_p{q:g}"] = np.percentile(samples, q, axis=1)
+
+    return result
 
 def apply_economic_impact_from_fund_stock(
     industry_year_df,
@@ -1298,24 +2687,17 @@ def apply_economic_impact_from_fund_stock(
     (closing_fund_with_return) instead of annual contributions.
     """
 
-    df = industry_year_df.copy()
-    econ = economic_df.copy()
+    df = industry_year_df.copy(deep=False)
+    econ = economic_df.copy(deep=False)
 
     # ----------------------------------------------------------
     # 1. STANDARDIZE KEYS
     # ----------------------------------------------------------
-    df["industry"] = (
-        df["industry"]
-        .astype(str)
-        .str.strip()
-        .str.lower()
-    )
+    df["industry"] = normalize_key(df["industry"])
 
-    econ["industry"] = (
-        econ["Industry"]
-        .astype(str)
-        .str.strip()
-        .str.lower()
+    econ["industry"] = align_key(
+        normalize_key(econ["Industry"]),
+        df["industry"]
     )
 
     # ----------------------------------------------------------
@@ -0,0 +1,115 @@
+"""
+Precomputes the dashboard's Fund Return × TER scenario cube.
+
+    python precompute_cube.py
+    python precompute_cube.py --return-step 0.25 --workers 8
+
+Evaluates the engine on the slider lattice for the bundled data/
+files and the default (unedited) assumptions, and writes the
+Industry × Year cube that app.py serves slider changes from. Rerun
+it after changing the data files or the engine; a stale cube is
+ignored by the app.
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from pipeline import *
+from engine import (
+    CUBE_TER_RATES,
+    apply_assumption_overrides,
+    build_scenario_cube,
+    make_engine_data,
+    save_scenario_cube
+)
+from ingestion import load_employee_base
+
+
+BASE_YEAR = 2025
+
+INDUSTRY_DESC = "data/Industry Desc.csv"
+INDUSTRY_RATES = "data/P2 Industry rates.csv"
+EMPLOYEE_SALARY = "data/Employee_Salary_Data_2025.csv"
+META_INFO = "data/Meta_info.csv"
+ECONOMIC_FILE = "data/Economic Parameters.csv"
+SCENARIO_CUBE_FILE = "data/scenario_cube.npz"
+
+
+def load_dashboard_inputs():
+    """
+    Same inputs, keys and dtypes as the app's cached loaders.
+    """
+    raw = generate_merged_industry_data(
+        pd.read_csv(INDUSTRY_DESC),
+        pd.read_csv(INDUSTRY_RATES)
+    )
+
+    employee = load_employee_base(EMPLOYEE_SALARY)
+
+    economic = pd.read_csv(ECONOMIC_FILE)
+
+    key_dtypes = build_key_dtypes(
+        raw,
+        employee,
+        pd.read_csv(META_INFO),
+        economic
+    )
+
+    economic = normalize_keys(economic, *key_dtypes)
+    economic["Industry"] = normalize_key(economic["Industry"])
+
+    data = make_engine_data(
+        normalize_keys(employee, *key_dtypes),
+        normalize_keys(pd.read_csv(META_INFO), *key_dtypes),
+        economic
+    )
+
+    return data, normalize_keys(raw, *key_dtypes)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--return-step",
+        type=float,
+        default=0.5,
+        help="Fund Return lattice step in percentage points"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output", default=SCENARIO_CUBE_FILE)
+    args = parser.parse_args(argv)
+
+    enable_copy_on_write()
+
+    data, merged_df = load_dashboard_inputs()
+
+    fund_returns = np.round(
+        np.arange(0.0, 12.0 + 1e-9, args.return_step) / 100, 6
+    )
+
+    start = time.perf_counter()
+
+    cube = build_scenario_cube(
+        data,
+        apply_assumption_overrides(merged_df),
+        fund_returns=fund_returns,
+        ter_rates=CUBE_TER_RATES,
+        start_year=BASE_YEAR,
+        workers=args.workers
+    )
+
+    save_scenario_cube(cube, args.output)
+
+    print(
+        f"{len(fund_returns)} returns × {len(CUBE_TER_RATES)} TER rates "
+        f"in {time.perf_counter() - start:.1f}s → {args.output} "
+        f"({os.path.getsize(args.output) / 1024 ** 2:.1f} MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
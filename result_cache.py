@@ -0,0 +1,146 @@
+"""
+Persistent on-disk cache for engine results.
+
+Entries survive restarts and are shared by every process on the host
+that points at the same directory. Each entry is a directory named by
+its key with one file per frame: Parquet when pyarrow is installed,
+pickle otherwise. Entries are written to a temporary directory and
+renamed into place, so readers never see a partial entry.
+
+Total size is bounded with least-recently-used eviction; a hit
+refreshes the entry's modification time.
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+
+MAX_CACHE_MB = 512
+
+FRAME_SUFFIX = ".parquet" if PARQUET_AVAILABLE else ".pkl"
+
+# What a concurrently evicted or half-written entry can raise on read
+_READ_ERRORS = (OSError, ValueError, EOFError, pickle.UnpicklingError)
+
+
+def _write_frame(df, path):
+    if path.endswith(".parquet"):
+        df.to_parquet(path)
+    else:
+        df.to_pickle(path)
+
+
+def _read_frame(path):
+    if path.endswith(".parquet"):
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def cache_get(directory, key):
+    """
+    Tuple of frames stored under key, or None on a miss. An entry
+    that cannot be read is removed, so the next put rewrites it.
+    """
+    entry = os.path.join(directory, key)
+
+    try:
+        names = sorted(os.listdir(entry))
+    except OSError:
+        return None
+
+    try:
+        frames = tuple(
+            _read_frame(os.path.join(entry, name)) for name in names
+        )
+        os.utime(entry)
+    except _READ_ERRORS:
+        shutil.rmtree(entry, ignore_errors=True)
+        return None
+
+    return frames
+
+
+def cache_put(directory, key, frames, max_mb=MAX_CACHE_MB):
+    """
+    Stores a sequence of frames under key, then evicts the least
+    recently used entries beyond max_mb.
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    entry = os.path.join(directory, key)
+    if os.path.isdir(entry):
+        return
+
+    staging = tempfile.mkdtemp(prefix=".staging-", dir=directory)
+
+    try:
+        for i, df in enumerate(frames):
+            _write_frame(df, os.path.join(staging, f"{i:03d}{FRAME_SUFFIX}"))
+
+        os.rename(staging, entry)
+    except OSError:
+        # Another process stored the same key first
+        shutil.rmtree(staging, ignore_errors=True)
+        return
+
+    evict(directory, max_mb)
+
+
+def cached(directory, key, compute, max_mb=MAX_CACHE_MB):
+    """
+    Frames under key, computing and storing them on a miss.
+    compute() returns a tuple of frames.
+    """
+    frames = cache_get(directory, key)
+
+    if frames is None:
+        frames = tuple(compute())
+        cache_put(directory, key, frames, max_mb)
+
+    return frames
+
+
+def _entry_size(entry):
+    total = 0
+    for name in os.listdir(entry):
+        total += os.path.getsize(os.path.join(entry, name))
+    return total
+
+
+def evict(directory, max_mb=MAX_CACHE_MB):
+    """
+    Removes least recently used entries until the cache fits max_mb.
+    """
+    entries = []
+
+    for name in os.listdir(directory):
+        if name.startswith("."):
+            continue
+
+        entry = os.path.join(directory, name)
+
+        try:
+            entries.append(
+                (os.path.getmtime(entry), _entry_size(entry), entry)
+            )
+        except OSError:
+            continue
+
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, entry in sorted(entries):
+        if total <= max_mb * 1024 ** 2:
+            break
+
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= size
@@ -0,0 +1,126 @@
+"""
+Shared fixtures: the bundled data, and a small slice of it (two
+industries, 2025-2030) run through the same stages as the dashboard.
+"""
+
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from pipeline import *  # noqa: E402
+
+
+DATA = os.path.join(ROOT, "data")
+FIXTURES = os.path.join(ROOT, "tests", "data")
+
+START_YEAR = 2025
+END_YEAR = 2030
+N_INDUSTRIES = 2
+
+
+def _read(name):
+    return pd.read_csv(os.path.join(DATA, name))
+
+
+def _for_industries(df, industries, column="Industry"):
+    return df[df[column].isin(industries)].reset_index(drop=True)
+
+
+def wide_forecast(long, value, prefix):
+    """
+    The pre-long prefix_YYYY layout of a long forecast frame (rows in
+    key then year order).
+    """
+    years = sorted(long["Year"].unique())
+    values = long[value].to_numpy().reshape(-1, len(years))
+
+    wide = long.iloc[::len(years)][EMPLOYEE_KEYS].reset_index(drop=True)
+    for j, year in enumerate(years):
+        wide[f"{prefix}_{year}"] = values[:, j]
+
+    return wide
+
+
+@pytest.fixture(scope="session")
+def full_inputs():
+    raw = generate_merged_industry_data(
+        _read("Industry Desc.csv"),
+        _read("P2 Industry rates.csv")
+    )
+    employee = _read("Employee_Salary_Data_2025.csv")
+    meta = _read("Meta_info.csv")
+    economic = _read("Economic Parameters.csv")
+
+    key_dtypes = build_key_dtypes(raw, employee, meta, economic)
+
+    economic = normalize_keys(economic, *key_dtypes)
+    economic["Industry"] = normalize_key(economic["Industry"])
+
+    return {
+        "merged": normalize_keys(raw, *key_dtypes),
+        "employee": normalize_keys(employee, *key_dtypes),
+        "meta": normalize_keys(meta, *key_dtypes),
+        "economic": economic
+    }
+
+
+@pytest.fixture(scope="session")
+def engine_data(full_inputs):
+    from engine import make_engine_data
+
+    return make_engine_data(
+        full_inputs["employee"],
+        full_inputs["meta"],
+        full_inputs["economic"]
+    )
+
+
+@pytest.fixture(scope="session")
+def inputs(full_inputs):
+    # Meta_info stays whole: the template's tenure range spans it
+    industries = full_inputs["merged"]["Industry"].cat.categories[:N_INDUSTRIES]
+
+    return {
+        "industries": industries,
+        "merged": _for_industries(full_inputs["merged"], industries),
+        "employee": _for_industries(full_inputs["employee"], industries),
+        "meta": full_inputs["meta"]
+    }
+
+
+@pytest.fixture(scope="session")
+def survival_with_employees(inputs):
+    emp_forecast, sal_forecast = generate_employee_salary_forecast(
+        inputs["employee"],
+        inputs["merged"],
+        start_year=START_YEAR,
+        end_year=END_YEAR
+    )
+
+    template = _for_industries(
+        generate_survival_template_cohort_style(
+            inputs["meta"],
+            start_year=START_YEAR,
+            end_year=END_YEAR
+        ),
+        inputs["industries"]
+    )
+
+    return attach_employees_to_survival(
+        attach_salary_to_survival(template, sal_forecast),
+        emp_forecast
+    )
+
+
+@pytest.fixture(scope="session")
+def survival_ready(inputs, survival_with_employees):
+    return attach_exit_and_replacement(
+        survival_with_employees,
+        inputs["merged"],
+        end_year=END_YEAR
+    )
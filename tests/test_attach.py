@@ -0,0 +1,118 @@
+import pandas as pd
+import pytest
+
+from pipeline import *
+
+from conftest import END_YEAR, START_YEAR, wide_forecast
+
+
+def _reference_attach(surv, forecast, prefix, value):
+    # Pre-panel path: melt the wide forecast to long, parse the year,
+    # four-key merge
+    surv = surv.copy(deep=False)
+    forecast = forecast.copy(deep=False)
+
+    surv.columns = surv.columns.str.strip()
+    forecast.columns = forecast.columns.str.strip()
+    forecast = forecast.rename(columns={"Age_Brackets": "Age_Bracket"})
+
+    long = forecast.melt(
+        id_vars=["Industry", "Age_Bracket", "Tenure"],
+        value_vars=[c for c in forecast.columns if c.startswith(f"{prefix}_")],
+        var_name="Year",
+        value_name=value
+    )
+    long["Year"] = long["Year"].str.extract(r"(\d+)").astype(int)
+
+    if value == "Employees":
+        long = long[long["Employees"] > 0]
+
+    merged = surv.merge(
+        long,
+        on=["Industry", "Age_Bracket", "Tenure", "Year"],
+        how="left"
+    )
+
+    if value == "Employees":
+        merged["Employees"] = merged["Employees"].fillna(0)
+
+    return merged
+
+
+@pytest.fixture(scope="module")
+def forecasts(inputs):
+    return generate_employee_salary_forecast(
+        inputs["employee"],
+        inputs["merged"],
+        start_year=START_YEAR,
+        end_year=END_YEAR
+    )
+
+
+@pytest.fixture(scope="module")
+def template(inputs):
+    # Template rows for every industry: those outside the forecast
+    # exercise the missing-key path
+    return generate_survival_template_cohort_style(
+        inputs["meta"],
+        start_year=START_YEAR,
+        end_year=END_YEAR
+    )
+
+
+def test_salary_matches_merge(template, forecasts):
+    _, salary = forecasts
+
+    pd.testing.assert_frame_equal(
+        attach_salary_to_survival(template, salary),
+        _reference_attach(
+            template, wide_forecast(salary, "Salary", "Salary"), "Salary", "Salary"
+        ),
+        check_exact=True
+    )
+
+
+def test_employees_match_merge(template, forecasts):
+    employees, _ = forecasts
+
+    pd.testing.assert_frame_equal(
+        attach_employees_to_survival(template, employees),
+        _reference_attach(
+            template, wide_forecast(employees, "Employees", "Emp"), "Emp", "Employees"
+        ),
+        check_exact=True
+    )
+
+
+def test_wide_forecasts_attach_like_long(template, forecasts):
+    employees, salary = forecasts
+
+    pd.testing.assert_frame_equal(
+        attach_salary_to_survival(
+            template, wide_forecast(salary, "Salary", "Salary")
+        ),
+        attach_salary_to_survival(template, salary),
+        check_exact=True
+    )
+    pd.testing.assert_frame_equal(
+        attach_employees_to_survival(
+            template, wide_forecast(employees, "Employees", "Emp")
+        ),
+        attach_employees_to_survival(template, employees),
+        check_exact=True
+    )
+
+
+def test_missing_keys(template, forecasts, inputs):
+    employees, salary = forecasts
+
+    attached = attach_employees_to_survival(
+        attach_salary_to_survival(template, salary),
+        employees
+    )
+    outside = ~attached["Industry"].isin(inputs["industries"])
+
+    assert outside.any()
+    assert attached.loc[outside, "Salary"].isna().all()
+    assert (attached.loc[outside, "Employees"] == 0).all()
+    assert attached.loc[~outside, "Salary"].notna().any()
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from pipeline import *
+
+
+KEYS = ["Industry", "Age_Brackets", "Tenure"]
+
+
+def _reference_employee_base(df_emp):
+    # The merge of a groupby-sum and a groupby-apply(np.average) this replaced
+    df = df_emp.rename(columns=lambda c: c.strip()).rename(columns={
+        "Average Basic Salary": "Average_Base_Salary"
+    })
+
+    emp_agg = df.groupby(KEYS, as_index=False)["Employees"].sum()
+
+    sal_agg = (
+        df.groupby(KEYS)
+        .apply(lambda x: np.average(x["Average_Base_Salary"], weights=x["Employees"]))
+        .reset_index(name="Average_Base_Salary")
+    )
+
+    return emp_agg.merge(sal_agg, on=KEYS)
+
+
+def test_sum_weighting_matches_np_average(inputs):
+    pd.testing.assert_frame_equal(
+        aggregate_employee_base(inputs["employee"]),
+        _reference_employee_base(inputs["employee"]),
+        check_exact=True
+    )
+
+
+def test_rows_without_salary_are_dropped(caplog):
+    df_emp = pd.DataFrame({
+        "Industry": ["Mining", "Mining", "Mining"],
+        "Age_Brackets": ["<55", "<55", "55-59"],
+        "Tenure": [1, 1, 1],
+        " Employees": [10, 30, 5],
+        "Average Basic Salary": [1000.0, np.nan, 2000.0]
+    })
+
+    base = aggregate_employee_base(df_emp)
+
+    assert base["Age_Brackets"].tolist() == ["55-59", "<55"]
+    assert base["Employees"].tolist() == [5, 10]
+    assert base["Average_Base_Salary"].tolist() == [2000.0, 1000.0]
+    assert "Dropping 1 employee rows" in caplog.text
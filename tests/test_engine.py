@@ -0,0 +1,84 @@
+import pandas as pd
+
+import engine
+
+from conftest import START_YEAR
+
+
+def _run(data, assumptions, fund_return=0.08, ter_rate=0.01, leakage_rate=0.28):
+    return engine.run_engine(
+        data, assumptions, fund_return, ter_rate, leakage_rate,
+        0, 0, 0, start_year=START_YEAR
+    )
+
+
+def test_industry_fingerprints_accept_plain_string_keys(full_inputs):
+    merged = full_inputs["merged"]
+    plain = merged.assign(Industry=merged["Industry"].astype(str))
+
+    # Row hashes depend on the column dtype; the industries must match
+    assert engine.industry_fingerprints(plain).keys() == engine.industry_fingerprints(merged).keys()
+
+
+def test_run_engine_accepts_plain_string_assumptions(full_inputs, engine_data):
+    merged = full_inputs["merged"]
+    plain = merged.assign(Industry=merged["Industry"].astype(str))
+
+    expected = _run(engine_data, merged)
+    actual = _run(engine_data, plain)
+
+    # The industry key keeps the dtype it came in with
+    for a, b in zip(expected, actual):
+        pd.testing.assert_frame_equal(
+            a.astype({"industry": str}).reset_index(drop=True),
+            b.astype({"industry": str}).reset_index(drop=True),
+            check_exact=True
+        )
+
+
+def _stage_deltas(run):
+    before = engine.stage_run_counts()
+    run()
+    after = engine.stage_run_counts()
+    return {stage: after[stage] - before[stage] for stage in after if after[stage] != before[stage]}
+
+
+def test_stage_memo_reruns_only_downstream_stages(full_inputs, engine_data):
+    merged = full_inputs["merged"]
+
+    engine.clear_stage_cache()
+    _run(engine_data, merged)
+
+    # Same scenario: nothing recomputed
+    assert _stage_deltas(lambda: _run(engine_data, merged)) == {}
+
+    # Leakage only feeds the economic layer
+    assert _stage_deltas(
+        lambda: _run(engine_data, merged, leakage_rate=0.3)
+    ) == {"economic": 1}
+
+    # Fund return skips template and survival
+    assert _stage_deltas(
+        lambda: _run(engine_data, merged, fund_return=0.05)
+    ) == {
+        "fund": 1,
+        "aggregate": 1,
+        "combined": 1,
+        "industry_year": 1,
+        "economic": 1
+    }
+
+    # One industry's assumptions rerun survival for that industry only
+    edited = merged.copy()
+    industry = edited["Industry"].cat.categories[0]
+    edited.loc[edited["Industry"] == industry, "Salary Growth %"] += 0.01
+
+    assert _stage_deltas(lambda: _run(engine_data, edited)) == {
+        "survival": 1,
+        "fund": 1,
+        "aggregate": 1,
+        "combined": 1,
+        "industry_year": 1,
+        "economic": 1
+    }
+    assert len(engine._stage_cache["survival"]) == len(engine_data["industries"]) + 1
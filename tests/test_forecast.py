@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+
+from pipeline import *
+from pipeline import _project_salary_panel
+
+from conftest import END_YEAR, START_YEAR, wide_forecast
+
+
+def _reference_salary_matrix(salary, merged):
+    # The per-group double loop the salary panel replaced
+    growth_by_group = merged.set_index(["Industry", "Age_Bracket"])["Salary Growth %"]
+    salary_cols = [f"Salary_{y}" for y in range(START_YEAR, END_YEAR + 1)]
+
+    expected = salary.copy()
+
+    for (ind, age), g in salary.groupby(["Industry", "Age_Brackets"]):
+
+        g = g.sort_values("Tenure")
+        growth = 1 + growth_by_group.get((ind, age), 0)
+
+        matrix = np.zeros((len(g), len(salary_cols)))
+        matrix[:, 0] = g[salary_cols[0]].values
+
+        for j in range(1, len(salary_cols)):
+            matrix[0, j] = matrix[0, j - 1] * growth
+
+        for i in range(1, len(g)):
+            for j in range(1, len(salary_cols)):
+                matrix[i, j] = matrix[i - 1, j - 1] * growth
+
+        expected.loc[g.index, salary_cols] = matrix
+
+    return expected
+
+
+def _reference_wide_forecast(df_emp, merged):
+    # The wide forecast the long output replaced: Emp_* and Salary_*
+    # columns added a year at a time
+    rates = merged.rename(columns={"Age_Bracket": "Age_Brackets"})
+
+    df = aggregate_employee_base(df_emp).merge(
+        rates[["Industry", "Age_Brackets", "Salary Growth %", "Expansion Hiring %"]],
+        on=["Industry", "Age_Brackets"],
+        how="left"
+    )
+
+    years = list(range(START_YEAR, END_YEAR + 1))
+    tenure0 = df["Tenure"] == 0
+
+    df[f"Emp_{START_YEAR}_cum"] = df["Employees"]
+
+    for year in years[1:]:
+        df.loc[tenure0, f"Emp_{year}_cum"] = (
+            df.loc[tenure0, f"Emp_{year - 1}_cum"]
+            * (1 + df.loc[tenure0, "Expansion Hiring %"])
+        )
+        df.loc[~tenure0, f"Emp_{year}_cum"] = 0
+
+    df = df.sort_values(EMPLOYEE_KEYS)
+
+    salary_cols = [f"Salary_{y}" for y in years]
+    salary_panel = _project_salary_panel(
+        df["Average_Base_Salary"].to_numpy(dtype=float),
+        1 + df["Salary Growth %"].to_numpy(dtype=float),
+        ~df.duplicated(["Industry", "Age_Brackets"]).to_numpy(),
+        len(years)
+    )
+    df = pd.concat(
+        [df, pd.DataFrame(salary_panel, index=df.index, columns=salary_cols)],
+        axis=1
+    )
+
+    df[f"Emp_{START_YEAR}"] = df[f"Emp_{START_YEAR}_cum"]
+    for year in years[1:]:
+        df[f"Emp_{year}"] = df[f"Emp_{year}_cum"] - df[f"Emp_{year - 1}_cum"]
+
+    emp_cols = [f"Emp_{y}" for y in years]
+    df.loc[~tenure0, emp_cols[1:]] = 0
+
+    return df[EMPLOYEE_KEYS + emp_cols], df[EMPLOYEE_KEYS + salary_cols]
+
+
+def _melted(wide, prefix, value):
+    long = wide.melt(
+        id_vars=EMPLOYEE_KEYS,
+        value_vars=[c for c in wide.columns if c.startswith(f"{prefix}_")],
+        var_name="Year",
+        value_name=value
+    )
+    long["Year"] = long["Year"].str[len(prefix) + 1:].astype("int64")
+
+    return long.sort_values(
+        EMPLOYEE_KEYS + ["Year"], kind="stable"
+    ).reset_index(drop=True)
+
+
+def test_long_forecast_equals_wide_melted(inputs):
+    employees, salary = generate_employee_salary_forecast(
+        inputs["employee"],
+        inputs["merged"],
+        start_year=START_YEAR,
+        end_year=END_YEAR
+    )
+    wide_employees, wide_salary = _reference_wide_forecast(
+        inputs["employee"], inputs["merged"]
+    )
+
+    assert employees["Year"].dtype == np.int64
+
+    pd.testing.assert_frame_equal(
+        employees,
+        _melted(wide_employees, "Emp", "Employees"),
+        check_exact=True
+    )
+    pd.testing.assert_frame_equal(
+        salary,
+        _melted(wide_salary, "Salary", "Salary"),
+        check_exact=True
+    )
+
+
+def test_salary_panel_matches_per_group_matrix(inputs):
+    _, salary = generate_employee_salary_forecast(
+        inputs["employee"],
+        inputs["merged"],
+        start_year=START_YEAR,
+        end_year=END_YEAR
+    )
+    salary = wide_forecast(salary, "Salary", "Salary")
+
+    pd.testing.assert_frame_equal(
+        salary,
+        _reference_salary_matrix(salary, inputs["merged"]),
+        check_exact=True
+    )
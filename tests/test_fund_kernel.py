@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from pipeline import *
+from pipeline import _fund_kernel, _fund_kernel_numpy
+
+from conftest import START_YEAR
+
+
+@pytest.fixture(scope="module")
+def combined(survival_ready):
+    return run_full_survival_eosg_model(survival_ready, start_year=START_YEAR)
+
+
+def _kernel_inputs(combined):
+    cohort_start = ~combined.duplicated(["industry", "age_bracket", "cohort"])
+
+    return (
+        cohort_start.to_numpy(),
+        combined["year"].to_numpy(dtype=np.int64),
+        combined["fund_contribution"].to_numpy(dtype=float),
+        combined["survived_employee"].to_numpy(dtype=float),
+        combined["exit_employee"].to_numpy(dtype=float)
+    )
+
+
+@pytest.mark.parametrize("rates", [(0.08, 0.01), (0.0, 0.0), (0.12, 0.03)])
+def test_numpy_kernel_matches_scalar_kernel(combined, rates):
+    args = (*_kernel_inputs(combined), *rates, START_YEAR)
+
+    expected = _fund_kernel(*args)
+    actual = _fund_kernel_numpy(*args)
+
+    for name, a, b in zip(FUND_COLUMNS, expected, actual):
+        np.testing.assert_array_equal(a, b, err_msg=name)
+
+
+@pytest.mark.skipif(not NUMBA_AVAILABLE, reason="numba is not installed")
+def test_numba_kernel_matches_numpy_kernel(combined):
+    inputs = _kernel_inputs(combined)
+
+    compiled = fund_roll_forward(*inputs, use_numba=True)
+    fallback = fund_roll_forward(*inputs, use_numba=False)
+
+    for name in FUND_COLUMNS:
+        np.testing.assert_array_equal(compiled[name], fallback[name], err_msg=name)
+
+
+def test_chunked_roll_forward_matches_single_chunk(combined):
+    inputs = _kernel_inputs(combined)
+
+    single = fund_roll_forward(*inputs, workers=1)
+    chunked = fund_roll_forward(*inputs, workers=3)
+
+    for name in FUND_COLUMNS:
+        np.testing.assert_array_equal(single[name], chunked[name], err_msg=name)
@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+
+from pipeline import *
+
+from conftest import START_YEAR
+
+
+def _reference_fund_scenarios(combined_df, start_year, ter_rate, return_rates):
+    # The per-cohort, per-rate iterrows() walk this function replaced
+    df = combined_df.sort_values(["industry", "age_bracket", "cohort", "year"])
+
+    result_blocks = []
+
+    for _, g in df.groupby(["industry", "age_bracket", "cohort"], sort=False):
+
+        g = g.sort_values("year").copy()
+
+        for label, r in return_rates.items():
+
+            fund = 0.0
+            balances = []
+
+            for _, row in g.iterrows():
+
+                opening_members = row["survived_employee"] + row["exit_employee"]
+
+                if row["year"] == start_year:
+                    contribution_for_fund = 0.0
+                    apply_return = False
+                else:
+                    contribution_for_fund = row["fund_contribution"]
+                    apply_return = True
+
+                fund_before_exit = fund + contribution_for_fund
+
+                if opening_members > 0:
+                    asset_per_employee = fund_before_exit / opening_members
+                else:
+                    asset_per_employee = 0.0
+
+                fund_after_exit = (
+                    fund_before_exit - row["exit_employee"] * asset_per_employee
+                )
+
+                if apply_return:
+                    fund_after_return = fund_after_exit * (1 + r)
+                    fund = fund_after_return - fund_after_return * ter_rate
+                else:
+                    fund = fund_after_exit
+
+                balances.append(fund)
+
+            g[f"fund_{label}"] = balances
+            g[f"fund_{label}_exit_adj"] = balances
+
+        result_blocks.append(g[
+            [
+                "industry", "age_bracket", "cohort", "year", "tenure",
+                "survived_employee", "exit_employee", "fund_contribution"
+            ]
+            + [f"fund_{label}" for label in return_rates]
+            + [f"fund_{label}_exit_adj" for label in return_rates]
+        ])
+
+    return pd.concat(result_blocks).reset_index(drop=True)
+
+
+# The grid that was hard-coded before return_rates existed
+BASELINE_RATES = {"0": 0.00, "2": 0.02, "4": 0.04, "6": 0.06, "8": 0.08, "12": 0.12}
+
+
+@pytest.fixture(scope="module")
+def combined(survival_ready):
+    # The reference walk is slow: one industry
+    industry = survival_ready[
+        survival_ready["industry"] == survival_ready["industry"].iloc[0]
+    ]
+    return run_full_survival_eosg_model(industry, start_year=START_YEAR)
+
+
+def test_default_grid_matches_per_rate_walk(combined):
+    expected = _reference_fund_scenarios(
+        combined, START_YEAR, 0.01, BASELINE_RATES
+    )
+    actual = generate_cohort_fund_scenarios(combined, start_year=START_YEAR)
+
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+
+def test_custom_grid_labels_its_columns(combined):
+    grid = {"low": 0.01, "high": 0.1}
+
+    expected = _reference_fund_scenarios(combined, START_YEAR, 0.02, grid)
+    actual = generate_cohort_fund_scenarios(
+        combined, start_year=START_YEAR, ter_rate=0.02, return_rates=grid
+    )
+
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
@@ -0,0 +1,158 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pipeline import *
+from ingestion import *
+
+from conftest import DATA, END_YEAR, START_YEAR
+
+
+EMPLOYEE_CSV = os.path.join(DATA, "Employee_Salary_Data_2025.csv")
+
+
+def _write_csv(path, rows, employees_header=" Employees"):
+    header = f"Industry,Age_Brackets,Tenure,{employees_header},Average Basic Salary"
+    with open(path, "w") as f:
+        f.write("\n".join([header] + rows) + "\n")
+    return str(path)
+
+
+def _artifacts(cache_dir):
+    return sorted(os.listdir(cache_dir))
+
+
+def test_artifact_matches_fresh_parse(tmp_path):
+    cache_dir = str(tmp_path / "ingest")
+
+    built = load_employee_base(EMPLOYEE_CSV, cache_dir=cache_dir)
+    artifact, = _artifacts(cache_dir)
+    built_at = os.path.getmtime(os.path.join(cache_dir, artifact))
+
+    loaded = load_employee_base(EMPLOYEE_CSV, cache_dir=cache_dir)
+
+    assert _artifacts(cache_dir) == [artifact]
+    assert os.path.getmtime(os.path.join(cache_dir, artifact)) == built_at
+
+    fresh = employee_base_sums(read_employee_csv(EMPLOYEE_CSV))
+
+    pd.testing.assert_frame_equal(built, fresh, check_exact=True)
+    pd.testing.assert_frame_equal(loaded, fresh, check_exact=True)
+
+
+def test_forecast_matches_microdata(tmp_path, inputs):
+    artifact = load_employee_base(EMPLOYEE_CSV, cache_dir=str(tmp_path))
+    employee = inputs["employee"]
+
+    key_dtypes = build_key_dtypes(
+        inputs["merged"], employee, inputs["meta"]
+    )
+    artifact = normalize_keys(
+        artifact[artifact["Industry"].isin(inputs["industries"])],
+        *key_dtypes
+    )
+    microdata = normalize_keys(employee, *key_dtypes)
+
+    for from_artifact, from_microdata in zip(
+        generate_employee_salary_forecast(
+            artifact, inputs["merged"], START_YEAR, END_YEAR
+        ),
+        generate_employee_salary_forecast(
+            microdata, inputs["merged"], START_YEAR, END_YEAR
+        )
+    ):
+        # Employees parse as float64 in the artifact, int64 from read_csv
+        pd.testing.assert_frame_equal(
+            from_artifact.reset_index(drop=True),
+            from_microdata.reset_index(drop=True),
+            check_dtype=False,
+            check_exact=True
+        )
+
+
+@pytest.mark.parametrize("chunksize", [997, 10_000])
+def test_streamed_sums_match_whole_file(chunksize):
+    # Small chunks leave keys out of whole chunks, so the folds
+    # also exercise the category union
+    streamed = stream_employee_base_sums(EMPLOYEE_CSV, chunksize=chunksize)
+    whole = employee_base_sums(read_employee_csv(EMPLOYEE_CSV))
+
+    pd.testing.assert_frame_equal(streamed, whole, check_exact=True)
+
+
+def test_header_only_file_streams_to_empty_sums(tmp_path):
+    path = _write_csv(tmp_path / "employees.csv", [])
+
+    streamed = stream_employee_base_sums(path)
+
+    assert streamed.empty
+    assert list(streamed.columns) == EMPLOYEE_KEYS + ["Employees", "salary_x_emp"]
+
+
+def test_edited_file_is_rebuilt(tmp_path):
+    cache_dir = str(tmp_path / "ingest")
+    path = _write_csv(tmp_path / "employees.csv", ["Mining,<55,0,10,1000"])
+
+    before = file_hash(path)
+    first = load_employee_base(path, cache_dir=cache_dir)
+
+    _write_csv(path, ["Mining,<55,0,10,1000", "Mining,<55,0,5,4000"])
+
+    assert file_hash(path) != before
+
+    second = load_employee_base(path, cache_dir=cache_dir)
+
+    assert len(_artifacts(cache_dir)) == 2
+    assert first["Employees"].tolist() == [10.0]
+    assert second["Employees"].tolist() == [15.0]
+    assert second["salary_x_emp"].tolist() == [30000.0]
+
+
+def test_headers_are_normalized(tmp_path):
+    path = _write_csv(
+        tmp_path / "employees.csv",
+        ["Mining,<55,0,10,1000"],
+        employees_header="  Employees "
+    )
+
+    df = read_employee_csv(path)
+
+    assert list(df.columns) == list(EMPLOYEE_DTYPES)
+    assert df["Employees"].tolist() == [10.0]
+
+
+def test_missing_column_is_reported(tmp_path):
+    path = str(tmp_path / "employees.csv")
+    with open(path, "w") as f:
+        f.write("Industry,Age_Brackets,Tenure,Average Basic Salary\n")
+
+    with pytest.raises(ValueError, match="Employees"):
+        read_employee_csv(path)
+
+
+def test_missing_and_fractional_employees_are_accepted(tmp_path):
+    path = _write_csv(
+        tmp_path / "employees.csv",
+        [
+            "Mining,<55,0,,1000",
+            "Mining,<55,0,2.5,2000",
+            "Mining,<55,1,3,1000"
+        ]
+    )
+
+    df = read_employee_csv(path)
+
+    assert np.isnan(df["Employees"].iloc[0])
+    assert df["Employees"].iloc[1] == 2.5
+
+    # Same sums as the employees read without compact dtypes
+    sums = load_employee_base(path, cache_dir=str(tmp_path / "ingest"))
+    expected = employee_base_sums(pd.read_csv(path))
+
+    pd.testing.assert_frame_equal(
+        sums, expected, check_dtype=False, check_categorical=False
+    )
+    assert sums["Employees"].tolist() == [2.5, 3.0]
+    assert sums["salary_x_emp"].tolist() == [5000.0, 3000.0]
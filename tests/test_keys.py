@@ -0,0 +1,30 @@
+import pandas as pd
+
+from pipeline import build_key_dtypes, normalize_key, normalize_keys
+
+
+def test_industry_only_in_economic_frame_is_kept():
+    rates = pd.DataFrame({"Industry": ["Construction"], "Age_Bracket": ["<55"]})
+    economic = pd.DataFrame({"Industry": ["Mining"], "Output Multiplier": [1.8]})
+
+    key_dtypes = build_key_dtypes(rates, economic)
+    economic = normalize_keys(economic, *key_dtypes)
+
+    assert economic["Industry"].tolist() == ["Mining"]
+
+
+def test_labels_differing_in_case_or_whitespace_share_a_category():
+    rates = pd.DataFrame({"Industry": ["Construction"], "Age_Bracket": ["<55"]})
+    economic = pd.DataFrame({"Industry": [" construction", "CONSTRUCTION "]})
+
+    key_dtypes = build_key_dtypes(rates, economic)
+    economic = normalize_keys(economic, *key_dtypes)
+
+    assert list(key_dtypes[0].categories) == ["Construction"]
+    assert economic["Industry"].tolist() == ["Construction", "Construction"]
+
+
+def test_normalize_key_collapses_case_duplicate_categories():
+    values = pd.Series(["Construction", "construction ", "Mining"], dtype="category")
+
+    assert normalize_key(values).tolist() == ["construction", "construction", "mining"]
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pipeline import *
+
+from conftest import START_YEAR
+
+
+@pytest.fixture(scope="module")
+def ledger(survival_ready):
+    return run_survival_liability_model(survival_ready, start_year=START_YEAR)
+
+
+def test_zero_volatility_median_matches_deterministic_fund(ledger):
+    simulated = run_monte_carlo_fund(
+        ledger,
+        n_paths=20,
+        mean_return=0.08,
+        volatility=0.0,
+        ter_rate=0.01,
+        start_year=START_YEAR,
+        seed=1
+    )
+
+    deterministic = aggregate_industry_year_combined(
+        run_fund_model(
+            ledger,
+            fund_return_rate=0.08,
+            ter_rate=0.01,
+            start_year=START_YEAR
+        )
+    )
+
+    np.testing.assert_allclose(
+        simulated["closing_fund_p50"].to_numpy(),
+        deterministic["closing_fund_with_return"].to_numpy(),
+        rtol=1e-12
+    )
+
+
+def test_result_does_not_depend_on_chunk_size(ledger):
+    options = dict(n_paths=50, start_year=START_YEAR, seed=7)
+
+    whole = run_monte_carlo_fund(ledger, **options)
+    # A few paths per chunk
+    chunked = run_monte_carlo_fund(ledger, max_chunk_mb=0.1, **options)
+
+    pd.testing.assert_frame_equal(whole, chunked, check_exact=True)
+
+
+def test_seed_makes_paths_reproducible(ledger):
+    options = dict(n_paths=50, start_year=START_YEAR)
+
+    first = run_monte_carlo_fund(ledger, seed=3, **options)
+    again = run_monte_carlo_fund(ledger, seed=3, **options)
+    other = run_monte_carlo_fund(ledger, seed=4, **options)
+
+    pd.testing.assert_frame_equal(first, again, check_exact=True)
+    assert not first["closing_fund_p50"].equals(other["closing_fund_p50"])
+
+
+@pytest.mark.parametrize("method", RETURN_PATH_METHODS)
+def test_return_paths_are_seeded(method):
+    history = np.array([0.05, -0.02, 0.11, 0.07])
+
+    a = simulate_return_paths(10, n_paths=5, method=method, history=history, seed=11)
+    b = simulate_return_paths(10, n_paths=5, method=method, history=history, seed=11)
+
+    assert a.shape == (10, 5)
+    np.testing.assert_array_equal(a, b)
+
+
+def test_engine_monte_carlo_reuses_the_survival_ledger(full_inputs, engine_data):
+    import engine
+
+    options = dict(n_paths=10, start_year=START_YEAR, seed=5)
+
+    first = engine.run_fund_monte_carlo(engine_data, full_inputs["merged"], **options)
+    runs = engine.stage_run_counts()
+
+    again = engine.run_fund_monte_carlo(
+        engine_data, full_inputs["merged"], volatility=0.2, **options
+    )
+
+    assert engine.stage_run_counts()["survival"] == runs["survival"]
+    assert not first["closing_fund_p50"].equals(again["closing_fund_p50"])
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from pipeline import *
+
+from conftest import END_YEAR, START_YEAR
+
+
+def _industry_year(survival_with_employees, merged):
+    combined = run_full_survival_eosg_model(
+        attach_exit_and_replacement(
+            survival_with_employees, merged, end_year=END_YEAR
+        ),
+        start_year=START_YEAR
+    )
+    return aggregate_industry_year_combined(combined)
+
+
+def test_pruning_keeps_industry_year_totals(inputs, survival_with_employees):
+    pruned = prune_empty_cohorts(survival_with_employees, start_year=START_YEAR)
+
+    assert 0 < len(pruned) < len(survival_with_employees)
+
+    pd.testing.assert_frame_equal(
+        _industry_year(pruned, inputs["merged"]),
+        _industry_year(survival_with_employees, inputs["merged"]),
+        check_exact=True
+    )
+
+
+def test_pruning_an_empty_frame_returns_it_unchanged(survival_with_employees):
+    empty = survival_with_employees.iloc[:0]
+
+    assert prune_empty_cohorts(empty, start_year=START_YEAR) is empty
@@ -0,0 +1,113 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+import engine
+from result_cache import *
+
+from conftest import START_YEAR
+
+
+def _frames():
+    return (
+        pd.DataFrame({
+            "industry": pd.Categorical(["mining", "construction", "mining"]),
+            "year": np.array([2026, 2026, 2027], dtype=np.int32),
+            "employees": [10.5, np.nan, 3.25],
+            "label": ["a", "b", "c"]
+        }),
+        pd.DataFrame({"value": np.arange(5, dtype=np.int64)})
+    )
+
+
+def _entry_files(directory, key):
+    entry = os.path.join(directory, key)
+    return [os.path.join(entry, name) for name in sorted(os.listdir(entry))]
+
+
+def test_stored_frames_read_back_identical(tmp_path):
+    frames = _frames()
+
+    cache_put(str(tmp_path), "key", frames)
+    stored = cache_get(str(tmp_path), "key")
+
+    assert len(stored) == len(frames)
+    for actual, expected in zip(stored, frames):
+        pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+
+def test_miss_returns_none(tmp_path):
+    assert cache_get(str(tmp_path), "missing") is None
+
+
+def test_eviction_drops_least_recently_used_entries(tmp_path):
+    directory = str(tmp_path)
+    frame = pd.DataFrame({"value": np.random.default_rng(0).random(20_000)})
+
+    for i, key in enumerate(["old", "middle", "new"]):
+        cache_put(directory, key, (frame,))
+        os.utime(os.path.join(directory, key), (1_000_000 + i, 1_000_000 + i))
+
+    entry_size = sum(os.path.getsize(f) for f in _entry_files(directory, "old"))
+
+    # Room for two entries
+    evict(directory, max_mb=2.5 * entry_size / 1024 ** 2)
+
+    assert sorted(os.listdir(directory)) == ["middle", "new"]
+
+
+def test_corrupt_entry_is_recomputed(tmp_path):
+    directory = str(tmp_path)
+    cache_put(directory, "key", _frames())
+
+    # A half-written file
+    path = _entry_files(directory, "key")[0]
+    with open(path, "r+b") as f:
+        f.truncate(os.path.getsize(path) // 2)
+
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return _frames()
+
+    frames = cached(directory, "key", compute)
+
+    assert calls == [1]
+    pd.testing.assert_frame_equal(frames[0], _frames()[0])
+
+    # Rewritten: the next read is a hit
+    cached(directory, "key", compute)
+    assert calls == [1]
+
+
+def test_results_from_other_engine_code_are_ignored(
+    full_inputs, engine_data, tmp_path, monkeypatch
+):
+    directory = str(tmp_path)
+
+    def run():
+        engine.clear_stage_cache()
+        return engine.run_engine(
+            engine_data, full_inputs["merged"], 0.08, 0.01, 0.28,
+            0, 0, 0, start_year=START_YEAR, disk_cache=directory
+        )
+
+    expected = run()
+    assert len(os.listdir(directory)) == 1
+
+    # Same code: served from disk, no stage reruns
+    before = engine.stage_run_counts()
+    run()
+    assert engine.stage_run_counts() == before
+
+    # Other code: a new entry, computed from scratch
+    monkeypatch.setattr(engine, "code_version", lambda: "0" * 12)
+    actual = run()
+
+    assert len(os.listdir(directory)) == 2
+    assert engine.stage_run_counts()["survival"] > before["survival"]
+
+    for a, b in zip(actual, expected):
+        pd.testing.assert_frame_equal(a, b, check_exact=True)
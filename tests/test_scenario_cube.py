@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import engine
+
+from conftest import START_YEAR
+
+
+FUND_RETURNS = [0.06, 0.08]
+TER_RATES = [0.01]
+
+
+@pytest.fixture(scope="module")
+def cube(full_inputs, engine_data):
+    return engine.build_scenario_cube(
+        engine_data,
+        full_inputs["merged"],
+        fund_returns=FUND_RETURNS,
+        ter_rates=TER_RATES,
+        start_year=START_YEAR,
+        workers=1
+    )
+
+
+def _run(data, assumptions, fund_return, cube=None):
+    return engine.run_engine(
+        data, assumptions, fund_return, 0.01, 0.28,
+        0, 0, 0, start_year=START_YEAR, cube=cube
+    )
+
+
+def test_lattice_point_matches_run_engine(full_inputs, engine_data, cube):
+    assert not engine.cube_point_interpolated(cube, 0.08, 0.01)
+
+    combined, industry_year, impact = _run(
+        engine_data, full_inputs["merged"], 0.08, cube=cube
+    )
+    _, expected_industry_year, expected_impact = _run(
+        engine_data, full_inputs["merged"], 0.08
+    )
+
+    # Served from the cube
+    assert combined is None
+
+    for actual, expected in [
+        (industry_year, expected_industry_year),
+        (impact, expected_impact)
+    ]:
+        pd.testing.assert_frame_equal(
+            actual.reset_index(drop=True),
+            expected.reset_index(drop=True),
+            check_exact=True
+        )
+
+
+def test_off_lattice_point_lies_between_neighbours(cube):
+    assert engine.cube_point_interpolated(cube, 0.07, 0.01)
+
+    low, mid, high = (
+        engine.lookup_scenario_cube(cube, r, 0.01)[list(cube["columns"])].to_numpy()
+        for r in (0.06, 0.07, 0.08)
+    )
+
+    # NaN cells (no members) stay NaN; the rest lie between the
+    # neighbours up to rounding in the blend
+    assert (np.isnan(mid) == np.isnan(low)).all()
+
+    slack = 1e-12 * np.maximum(np.abs(low), np.abs(high))
+
+    assert not (mid < np.minimum(low, high) - slack).any()
+    assert not (mid > np.maximum(low, high) + slack).any()
+    assert (mid != low).any()
+
+
+def test_stale_cubes_are_rejected_on_load(
+    full_inputs, engine_data, cube, tmp_path, monkeypatch
+):
+    path = str(tmp_path / "cube.npz")
+    engine.save_scenario_cube(cube, path)
+
+    current = engine.cube_fingerprint(engine_data, full_inputs["merged"], START_YEAR)
+
+    loaded = engine.load_scenario_cube(path, current)
+    np.testing.assert_array_equal(loaded["values"], cube["values"])
+
+    # Other inputs
+    edited = full_inputs["merged"].assign(
+        **{"Salary Growth %": full_inputs["merged"]["Salary Growth %"] + 0.01}
+    )
+    stale = engine.cube_fingerprint(engine_data, edited, START_YEAR)
+    assert engine.load_scenario_cube(path, stale) is None
+
+    # Other engine code
+    monkeypatch.setattr(engine, "code_version", lambda: "0" * 12)
+    assert engine.load_scenario_cube(path) is None
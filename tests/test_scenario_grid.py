@@ -0,0 +1,67 @@
+import itertools
+
+import pandas as pd
+import pytest
+
+import engine
+
+from conftest import START_YEAR
+
+
+FUND_RETURNS = [0.04, 0.08]
+TER_RATES = [0.01]
+LEAKAGE_RATES = [0.2, 0.28]
+
+SCENARIO_COLUMNS = ["scenario_id", "fund_return", "ter_rate", "leakage_rate"]
+
+
+@pytest.fixture(scope="module")
+def grid(full_inputs, engine_data):
+    return engine.run_scenario_grid(
+        engine_data,
+        full_inputs["merged"],
+        FUND_RETURNS,
+        TER_RATES,
+        LEAKAGE_RATES,
+        start_year=START_YEAR,
+        workers=1
+    )
+
+
+def test_process_pool_matches_serial_grid(full_inputs, engine_data, grid):
+    pooled = engine.run_scenario_grid(
+        engine_data,
+        full_inputs["merged"],
+        FUND_RETURNS,
+        TER_RATES,
+        LEAKAGE_RATES,
+        start_year=START_YEAR,
+        workers=2
+    )
+
+    pd.testing.assert_frame_equal(pooled, grid, check_exact=True)
+
+
+def test_every_scenario_matches_run_engine(full_inputs, engine_data, grid):
+    points = itertools.product(FUND_RETURNS, TER_RATES, LEAKAGE_RATES)
+
+    assert grid["scenario_id"].nunique() == len(FUND_RETURNS) * len(TER_RATES) * len(LEAKAGE_RATES)
+
+    for fund_return, ter_rate, leakage_rate in points:
+        _, _, expected = engine.run_engine(
+            engine_data, full_inputs["merged"],
+            fund_return, ter_rate, leakage_rate,
+            0, 0, 0, start_year=START_YEAR
+        )
+
+        scenario = grid[
+            (grid["fund_return"] == fund_return)
+            & (grid["ter_rate"] == ter_rate)
+            & (grid["leakage_rate"] == leakage_rate)
+        ]
+
+        pd.testing.assert_frame_equal(
+            scenario.drop(columns=SCENARIO_COLUMNS).reset_index(drop=True),
+            expected.reset_index(drop=True),
+            check_exact=True
+        )
@@ -0,0 +1,33 @@
+import pandas as pd
+
+from pipeline import *
+
+from conftest import START_YEAR
+
+
+def test_vectorized_engine_matches_loop_engine(survival_ready):
+    # The loop engine is slow: one industry, two age brackets
+    blocks = survival_ready[
+        (survival_ready["industry"] == survival_ready["industry"].iloc[0])
+        & survival_ready["age_bracket"].isin(["<55", "55-59"])
+    ]
+
+    vectorized = run_full_survival_eosg_model(
+        blocks, start_year=START_YEAR, engine="vectorized"
+    )
+    loop = run_full_survival_eosg_model(
+        blocks, start_year=START_YEAR, engine="loop"
+    )
+
+    pd.testing.assert_frame_equal(vectorized, loop, check_exact=True)
+
+
+def test_ledger_does_not_depend_on_workers(survival_ready):
+    single = run_survival_liability_model(
+        survival_ready, start_year=START_YEAR, workers=1
+    )
+    threaded = run_survival_liability_model(
+        survival_ready, start_year=START_YEAR, workers=3
+    )
+
+    pd.testing.assert_frame_equal(threaded, single, check_exact=True)
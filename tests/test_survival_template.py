@@ -0,0 +1,57 @@
+import pandas as pd
+
+from pipeline import *
+
+from conftest import END_YEAR, START_YEAR
+
+
+def _reference_template(meta_info_df, start_year, end_year):
+    # The triple-nested record lists the index arithmetic replaced
+    df_raw = meta_info_df.rename(columns=lambda c: c.strip())
+    industries = df_raw["Industry"].dropna().unique()
+    age_bracket = df_raw["Age_Bracket"].dropna().unique()
+    projection_years = range(start_year, end_year + 1)
+    records = []
+
+    for ind in industries:
+        for age in age_bracket:
+            for cohort_start in projection_years:
+                for year in projection_years:
+                    if year >= cohort_start:
+                        records.append([ind, age, f"{cohort_start}_0", year, year - cohort_start])
+
+    for ind in industries:
+        for age in age_bracket:
+            for initial_tenure in range(1, int(df_raw["Tenure"].max()) + 1):
+                for year in projection_years:
+                    records.append([
+                        ind, age, f"{start_year}_{initial_tenure}", year,
+                        initial_tenure + (year - start_year)
+                    ])
+
+    return pd.DataFrame(
+        records, columns=["Industry", "Age_Bracket", "cohort", "Year", "Tenure"]
+    ).sort_values(
+        ["Industry", "Age_Bracket", "cohort", "Year"]
+    ).reset_index(drop=True)
+
+
+def test_template_matches_nested_loops(inputs):
+    expected = _reference_template(inputs["meta"], START_YEAR, END_YEAR)
+
+    template = generate_survival_template_cohort_style(
+        inputs["meta"], start_year=START_YEAR, end_year=END_YEAR
+    )
+
+    # Keys are categoricals and cohorts integer codes, which sort
+    # numerically; the labelled rows are unchanged
+    template = template.astype({
+        "Industry": expected["Industry"].dtype,
+        "Age_Bracket": expected["Age_Bracket"].dtype
+    }).assign(
+        cohort=lambda df: cohort_labels(df["cohort"]).astype(expected["cohort"].dtype)
+    ).sort_values(
+        ["Industry", "Age_Bracket", "cohort", "Year"]
+    ).reset_index(drop=True)
+
+    pd.testing.assert_frame_equal(template, expected, check_exact=True)